@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+"""
+File: rk4.py
+
+Description:
+Iterative Runge-Kutta 4th order solver for equations of the form dy/dx = f(y, x), the same
+call signature used by odeint and by dydx in rfk_example.py. The solution is written into
+preallocated NumPy arrays instead of being built up by recursion and list appends, so the
+number of steps is no longer limited by Python's recursion limit. y may be a scalar or a
+vector (a system of first-order equations).
+
+For very long integrations rk4_stream yields the solution in fixed-size chunks (optionally
+keeping only every k-th sample), so memory use stays constant however many steps are taken.
+rk4_batch advances a whole array of initial conditions (x0, y0) in lockstep, evaluating the
+right-hand side once per stage for the entire ensemble.
+
+Packages:
+The module only depends on NumPy. The benchmark also uses SciPy's odeint for comparison.
+
+Components:
+- rk4_solve function: Iterative RK4 with preallocated output arrays.
+- rk4_stream function: Generator yielding the RK4 solution in fixed-size NumPy chunks.
+- rk4_batch function: Vectorized RK4 over an ensemble of initial conditions.
+- benchmark function: Times rk4_solve against the recursive solver and odeint.
+- stream_memory function: Shows that the peak memory of rk4_stream does not grow with the step count.
+- batch_throughput function: Compares solved initial conditions per second of rk4_batch against a
+  loop over rk4_solve.
+
+Usage:
+Import rk4_solve, rk4_stream or rk4_batch from another script, or run 'python3 rk4.py' to print the benchmark.
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+
+# One step of the Runge-Kutta 4th order method
+def _rk4_step(dydx, y, x, h):
+    k1 = dydx(y, x)
+    k2 = dydx(y + (h/2 * k1), x + h/2)
+    k3 = dydx(y + (h/2 * k2), x + h/2)
+    k4 = dydx(y + (h * k3), x + h)
+    return y + (h/6) * (k1 + 2 * k2 + 2 * k3 + k4)
+
+# Iterative Runge-Kutta 4th order method
+def rk4_solve(dydx, x0, y0, h, num_steps):
+    """Solve dy/dx = dydx(y, x) from (x0, y0) with num_steps RK4 steps of size h.
+    Returns (x_values, y_values) with num_steps + 1 entries each; y_values has shape
+    (num_steps + 1,) for a scalar y0 and (num_steps + 1, len(y0)) for a vector y0."""
+    y = np.asarray(y0, dtype=float)
+    x_values = x0 + h * np.arange(num_steps + 1)
+    y_values = np.empty((num_steps + 1,) + y.shape)
+    y_values[0] = y
+    if y.ndim == 0:
+        y = float(y)
+
+    # Calculate the next y value using the RK4 formula
+    for i in range(num_steps):
+        y = _rk4_step(dydx, y, x_values[i], h)
+        y_values[i + 1] = y
+
+    return x_values, y_values
+
+# Generator version of the RK4 method for long integrations
+def rk4_stream(dydx, x0, y0, h, num_steps=None, chunk_size=4096, every=1):
+    """Yield the RK4 solution of dy/dx = dydx(y, x) as (x_chunk, y_chunk) array pairs.
+    Only every k-th sample is kept (every=1 keeps all of them, starting with (x0, y0)),
+    and each chunk holds chunk_size kept samples except possibly the last one.
+    num_steps = total number of RK4 steps, or None to integrate indefinitely
+    Only one chunk buffer is held at a time, so memory use does not depend on num_steps."""
+    if chunk_size < 1 or every < 1:
+        raise ValueError("chunk_size and every must be at least 1")
+    if num_steps is not None and num_steps < 0:
+        raise ValueError("num_steps must not be negative")
+    y = np.asarray(y0, dtype=float)
+    x_buffer = np.empty(chunk_size)
+    y_buffer = np.empty((chunk_size,) + y.shape)
+    if y.ndim == 0:
+        y = float(y)
+
+    filled = 0
+    step = 0
+    while True:
+        if step % every == 0:
+            x_buffer[filled] = x0 + step * h
+            y_buffer[filled] = y
+            filled += 1
+            if filled == chunk_size:
+                yield x_buffer.copy(), y_buffer.copy()
+                filled = 0
+        if step == num_steps:
+            break
+        y = _rk4_step(dydx, y, x0 + step * h, h)
+        step += 1
+
+    if filled:
+        yield x_buffer[:filled].copy(), y_buffer[:filled].copy()
+
+# Vectorized RK4 method over many initial conditions
+def rk4_batch(dydx, x0, y0, h, num_steps, record=True):
+    """Solve dy/dx = dydx(y, x) for every pair of initial conditions in the arrays x0 and y0
+    (scalars are broadcast against arrays). dydx must accept arrays for both y and x, as
+    dydx in rfk_example.py does, and is called once per RK4 stage for the whole ensemble.
+    Returns (x_values, y_values) with shape (num_steps + 1, M), or only the final (M,)
+    arrays if record is False."""
+    if num_steps < 0:
+        raise ValueError("num_steps must not be negative")
+    x0, y = np.broadcast_arrays(np.asarray(x0, dtype=float), np.asarray(y0, dtype=float))
+    y = y.copy()
+    if record:
+        x_values = x0 + h * np.arange(num_steps + 1)[:, None]
+        y_values = np.empty((num_steps + 1,) + y.shape)
+        y_values[0] = y
+
+    for i in range(num_steps):
+        y = _rk4_step(dydx, y, x0 + i * h, h)
+        if record:
+            y_values[i + 1] = y
+
+    if record:
+        return x_values, y_values
+    return x0 + num_steps * h, y
+
+def _time(function, *args, **kwargs):
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+def benchmark(step_counts=(500, 10**4, 10**6)):
+    """Print the run time of the recursive solver, rk4_solve and odeint for each step count."""
+    from scipy.integrate import odeint
+    from rfk_example import dydx, runge_kutta_recursive
+
+    x0, y0, h = 1, 5, 0.02
+    print(f"{'steps':>10} {'recursive':>14} {'rk4_solve':>14} {'odeint':>14}")
+    for steps in step_counts:
+        try:
+            recursive = f"{_time(runge_kutta_recursive, x0, y0, h, steps + 1):.4f} s"
+        except RecursionError:
+            recursive = "RecursionError"
+        x_values = x0 + h * np.arange(steps + 1)
+        # exp(x) overflows to inf for the long runs, which correctly gives dy/dx = 0
+        with np.errstate(over='ignore'):
+            iterative = _time(rk4_solve, dydx, x0, y0, h, steps)
+            reference = _time(odeint, dydx, y0, x_values)
+        print(f"{steps:>10} {recursive:>14} {iterative:>12.4f} s {reference:>12.4f} s")
+
+def stream_memory(step_counts=(10**3, 10**4, 10**5), chunk_size=4096):
+    """Print the peak traced memory of consuming rk4_stream and of rk4_solve."""
+    from rfk_example import dydx
+
+    print(f"{'steps':>10} {'rk4_stream peak':>16} {'rk4_solve peak':>16}")
+    for steps in step_counts:
+        with np.errstate(over='ignore'):
+            tracemalloc.start()
+            for x_chunk, y_chunk in rk4_stream(dydx, 1, 5, 0.02, steps, chunk_size):
+                pass
+            stream_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            tracemalloc.start()
+            rk4_solve(dydx, 1, 5, 0.02, steps)
+            solve_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        print(f"{steps:>10} {stream_peak / 1024:>13.1f} KB {solve_peak / 1024:>13.1f} KB")
+
+def batch_throughput(batch_sizes=(10, 1000, 100000), steps=500, loop_size=50):
+    """Print initial conditions solved per second by rk4_batch and by a loop over rk4_solve."""
+    from rfk_example import dydx
+
+    rng = np.random.default_rng(0)
+    x0 = rng.uniform(0.5, 2, size=max(batch_sizes))
+    y0 = rng.uniform(1, 10, size=max(batch_sizes))
+
+    elapsed = _time(lambda: [rk4_solve(dydx, x0[i], y0[i], 0.02, steps) for i in range(loop_size)])
+    loop_rate = loop_size / elapsed
+    print(f"{'scalar loop':>12}: {loop_rate:12.1f} solutions/s")
+
+    for n in batch_sizes:
+        rate = n / _time(rk4_batch, dydx, x0[:n], y0[:n], 0.02, steps, record=False)
+        print(f"{'M = ' + str(n):>12}: {rate:12.1f} solutions/s  ({rate / loop_rate:.0f}x)")
+
+
+if __name__ == "__main__":
+    benchmark()
+    print()
+    stream_memory()
+    print("\nThroughput over 500 RK4 steps:")
+    batch_throughput()
@@ -0,0 +1,26 @@
+"""rk4_stream must yield the same samples as rk4_solve in any chunking, and the chunk and
+step arguments are validated before any step is taken."""
+
+import numpy as np
+import pytest
+
+from rk4 import rk4_batch, rk4_solve, rk4_stream
+
+def decay(y, x):
+    return -y
+
+def test_stream_matches_solve():
+    x_values, y_values = rk4_solve(decay, 0.0, 1.0, 0.01, 1000)
+    chunks = list(rk4_stream(decay, 0.0, 1.0, 0.01, 1000, chunk_size=64, every=3))
+    np.testing.assert_array_equal(np.concatenate([x for x, _ in chunks]), x_values[::3])
+    np.testing.assert_array_equal(np.concatenate([y for _, y in chunks]), y_values[::3])
+
+@pytest.mark.parametrize('options', [{'chunk_size': 0}, {'chunk_size': -5}, {'every': 0}, {'every': -1},
+                                     {'num_steps': -1}])
+def test_stream_rejects_invalid_sizes(options):
+    with pytest.raises(ValueError):
+        next(rk4_stream(decay, 0.0, 1.0, 0.01, **{'num_steps': 10, **options}))
+
+def test_batch_rejects_negative_steps():
+    with pytest.raises(ValueError):
+        rk4_batch(decay, 0.0, [1.0, 2.0], 0.01, -1, record=False)
@@ -9,39 +9,16 @@ Programmers: Owen Kroeger, Atu Ambala
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D     # noqa: F401 unused import
+from lorenz import simulate_lorenz
+from queue_models import mm1
+from queue_sim import simulate_queue
 
 # ==================================================================================
 # Part 1: Lorenz System
 # ==================================================================================
 
-# Function to compute derivatives of the Lorenz system
-def lorenz(x, y, z, s=10, r=28, b=2.667):
-    # Compute the derivatives
-    x_dot = s*(y - x)
-    y_dot = r*x - y - x*z
-    z_dot = x*y - b*z
-    return x_dot, y_dot, z_dot
-
-# Function to simulate and plot the Lorenz system
-def plot_lorenz(r, title):
-    dt = 0.01
-    num_steps = 10000
-    
-    # Arrays to store the values of x, y, and z
-    xs = np.empty(num_steps + 1)
-    ys = np.empty(num_steps + 1)
-    zs = np.empty(num_steps + 1)
-    
-    # Initial conditions
-    xs[0], ys[0], zs[0] = (0., 1., 1.05)
-    
-    # Iterate to compute the trajectory
-    for i in range(num_steps):
-        x_dot, y_dot, z_dot = lorenz(xs[i], ys[i], zs[i], r=r)
-        xs[i + 1] = xs[i] + (x_dot * dt)
-        ys[i + 1] = ys[i] + (y_dot * dt)
-        zs[i + 1] = zs[i] + (z_dot * dt)
-    
+# Function to plot a simulated Lorenz trajectory
+def plot_trajectory(xs, ys, zs, title):
     # Create a figure for plotting
     fig = plt.figure(figsize=(10, 8))
     
@@ -80,6 +57,12 @@ def plot_lorenz(r, title):
     plt.subplots_adjust(top=0.9)
     plt.show()
 
+# Function to simulate and plot the Lorenz system
+def plot_lorenz(r, title):
+    # Compute the trajectory without any plotting, then draw it
+    t, xs, ys, zs = simulate_lorenz(r=r, initial=(0., 1., 1.05), dt=0.01, num_steps=10000)
+    plot_trajectory(xs, ys, zs, title)
+
 # Plot for each scenario
 plot_lorenz(28, "Chaotic")       # Plot for chaotic scenario
 plot_lorenz(10, "Semi-Chaotic")  # Plot for semi-chaotic scenario
@@ -96,19 +79,22 @@ plot_lorenz(0, "Non-Chaotic")    # Plot for non-chaotic scenario
 # Arrival times and service durations
 arrival_times = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])
 service_durations = np.array([2.22, 1.76, 2.13, 0.14, 0.76, 0.70, 0.47, 0.22, 0.18, 2.41, 0.41, 0.46, 1.37, 0.27, 0.27])
-time_in_queue = np.array([0, 1.22, 1.98, 3.11, 2.25, 2.01, 1.71, 1.18, 0.4, 0, 1.41, 0.82, 0.28, 0.65, 0])
-num_in_queue = np.array([0, 0, 1, 1, 1, 2, 3, 2, 1, 0, 0, 1, 0, 0, 0])
+
+# Simulate the single-server queue to generate the rest of the table
+queue = simulate_queue(arrival_times, service_durations, servers=1)
+time_in_queue = queue['time_in_queue']
+num_in_queue = queue['num_in_queue']
 
 # Data arrays for plotting
-service_start_times = np.array([1, 3.22, 4.98, 7.11, 7.25, 8.01, 8.71, 9.18, 9.4, 10.0, 12.41, 12.82, 13.28, 14.65, 15.0])
-exit_times = np.array([3.22, 4.98, 7.11, 7.25, 8.01, 8.71, 9.18, 9.4, 9.58, 12.41, 12.82, 13.28, 14.65, 14.92, 15.27])
-time_in_queue = np.array([0, 1.22, 1.98, 3.11, 2.25, 2.01, 1.71, 1.18, 0.4, 0, 1.41, 0.82, 0.28, 0.65, 0])
-num_in_system = np.array([0, 1, 2, 2, 2, 3, 4, 3, 2, 0, 1, 2, 1, 1, 0])
+service_start_times = queue['service_start_times']
+exit_times = queue['exit_times']
+num_in_system = queue['num_in_system']
 
 L_q_A = np.mean(num_in_queue)
 print(f'L_q_A = ', L_q_A)
 
-L_q = round(np.sum(time_in_queue) / 15.27, 4)
+# Time-average over the whole run, which ends when the last customer exits (15.27)
+L_q = round(np.sum(time_in_queue) / exit_times[-1], 4)
 print(f'L_q = ', L_q)
 
 # Plotting
@@ -168,11 +154,12 @@ mu_initial = 20      # initial service rate, e.g., 20 packets per second
 # Range for k
 k_values = np.arange(1, 11, 1)  # k from 1 to 10
 
-# Metrics calculations
-utilization = [lambda_initial / mu_initial] * len(k_values)  # Utilization does not change
-throughput = [k * lambda_initial for k in k_values]  # Throughput increases linearly with k
-mean_number_in_system = [lambda_initial / mu_initial / (1 - lambda_initial / mu_initial)] * len(k_values)  # E[N] does not change
-mean_time_in_system = [1 / (k * (mu_initial - lambda_initial)) for k in k_values]  # E[T] decreases with k
+# Metrics calculations (M/M/1 with both rates scaled by k)
+metrics = mm1(lambda_initial, mu_initial, scale=k_values)
+utilization = metrics['utilization']  # Utilization does not change
+throughput = metrics['throughput']  # Throughput increases linearly with k
+mean_number_in_system = metrics['L']  # E[N] does not change
+mean_time_in_system = metrics['W']  # E[T] decreases with k
 
 # Plotting
 fig, axs = plt.subplots(2, 2, figsize=(12, 10))
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+"""
+File: capacity.py
+
+Description:
+Capacity planning on top of the analytic models in queue_models.py: the smallest service
+capacity whose mean time in system E[T] meets a latency target under a given arrival rate.
+
+- minimum_scale: the factor k by which the service rate mu must be multiplied. For an M/G/1
+  queue with service rate s = k * mu, setting E[T] = target and clearing denominators in the
+  Pollaczek-Khinchine formula gives the quadratic
+      2 * target * s^2 - 2 * (target * lambda + 1) * s + lambda * (1 - cv^2) = 0
+  whose larger root is the answer (for M/M/1 it reduces to s = lambda + 1 / target). With
+  scale_arrivals, lambda is scaled by k as well, as in Part 2-3 of ProjectFive.py; then E[T]
+  is simply E[T] at k = 1 divided by k.
+- minimum_servers: the number of servers c of an M/M/c queue. E[T] decreases as servers are
+  added, so each query starts at the smallest stable c, doubles its step until the target is
+  met and then bisects, which takes O(log c) evaluations instead of trying every c.
+
+Both functions answer a whole batch of services at once with NumPy arrays.
+
+Packages:
+The module uses NumPy and the models in queue_models.py.
+
+Components:
+- minimum_scale function: Closed-form smallest scale factor k meeting a latency target.
+- minimum_servers function: Bisection for the smallest number of servers meeting a latency target.
+- benchmark function: Time per query for batches of services, compared with trying every c.
+
+Usage:
+Import the functions from another script, or run 'python3 capacity.py' to print example answers
+and the benchmark; 'python3 -m pytest test_capacity.py' checks the answers against the models.
+"""
+
+import time
+
+import numpy as np
+
+from queue_models import mg1, mmc
+
+def minimum_scale(arrival_rate, service_rate, target_time, service_cv2=1, scale_arrivals=False, integer=False):
+    """Smallest k for which an M/G/1 queue with service rate k * service_rate (and arrival
+    rate k * arrival_rate if scale_arrivals) has a mean time in system of at most target_time.
+    service_cv2 = squared coefficient of variation of the service time (1 for M/M/1, 0 for M/D/1)
+    integer = round k up to a whole number
+    Arguments broadcast against each other. With scale_arrivals the queue must be stable at
+    k = 1 (lambda < mu); unstable entries get k = inf."""
+    arrival_rate = np.asarray(arrival_rate, dtype=float)
+    service_rate = np.asarray(service_rate, dtype=float)
+    target_time = np.asarray(target_time, dtype=float)
+    if np.any(target_time <= 0):
+        raise ValueError("target_time must be positive")
+
+    if scale_arrivals:
+        scale = mg1(arrival_rate, service_rate, service_cv2)['W'] / target_time
+    else:
+        # Larger root of 2 * T * s^2 - 2 * (T * lambda + 1) * s + lambda * (1 - cv^2) = 0
+        b = target_time * arrival_rate + 1
+        discriminant = b**2 - 2 * target_time * arrival_rate * (1 - np.asarray(service_cv2, dtype=float))
+        scale = (b + np.sqrt(discriminant)) / (2 * target_time * service_rate)
+    return np.ceil(scale) if integer else scale
+
+def minimum_servers(arrival_rate, service_rate, target_time):
+    """Smallest number of servers c for which an M/M/c queue has a mean time in system of at
+    most target_time. Arguments broadcast against each other. Returns an integer array;
+    0 marks services whose target is below the service time 1 / service_rate, which no
+    number of servers can reach."""
+    arrival_rate, service_rate, target_time = np.broadcast_arrays(np.asarray(arrival_rate, dtype=float),
+                                                                  np.asarray(service_rate, dtype=float),
+                                                                  np.asarray(target_time, dtype=float))
+    feasible = target_time > 1 / service_rate
+
+    def too_slow(servers):
+        return feasible & (mmc(arrival_rate, service_rate, servers)['W'] > target_time)
+
+    # Smallest stable number of servers, then double the step until the target is met
+    low = np.floor(arrival_rate / service_rate).astype(int) + 1
+    high = low.copy()
+    step = 1
+    slow = too_slow(high)
+    while np.any(slow):
+        low = np.where(slow, high + 1, low)
+        high = np.where(slow, high + step, high)
+        step *= 2
+        slow = too_slow(high)
+
+    # Bisect for the first c in [low, high] that meets the target
+    while np.any(low < high):
+        middle = (low + high) // 2
+        slow = too_slow(middle)
+        low = np.where(slow, middle + 1, low)
+        high = np.where(slow, high, middle)
+    return np.where(feasible, high, 0)
+
+def _minimum_servers_by_enumeration(arrival_rate, service_rate, target_time):
+    servers = int(arrival_rate // service_rate) + 1
+    while mmc(arrival_rate, service_rate, servers)['W'] > target_time:
+        servers += 1
+    return servers
+
+def benchmark(batch_sizes=(1, 1000, 100000), loop_size=200):
+    """Print the time per query of minimum_servers and minimum_scale for batches of random
+    services, and of trying every c for one service at a time."""
+    rng = np.random.default_rng(0)
+
+    def services(n):
+        service_rate = rng.uniform(1, 10, n)
+        arrival_rate = rng.uniform(1, 500, n)
+        return arrival_rate, service_rate, rng.uniform(1.01, 3, n) / service_rate
+
+    arrival_rate, service_rate, target_time = services(loop_size)
+    start = time.perf_counter()
+    expected = [_minimum_servers_by_enumeration(*query) for query in zip(arrival_rate, service_rate, target_time)]
+    loop_time = (time.perf_counter() - start) / loop_size
+    print(f"{'servers, every c':>28}: {loop_time * 1e6:10.2f} us/query")
+    assert np.array_equal(minimum_servers(arrival_rate, service_rate, target_time), expected)
+
+    for n in batch_sizes:
+        arrival_rate, service_rate, target_time = services(n)
+        for name, solver in (('servers, bisection', minimum_servers), ('scale, closed form', minimum_scale)):
+            start = time.perf_counter()
+            solver(arrival_rate, service_rate, target_time)
+            elapsed = (time.perf_counter() - start) / n
+            print(f"{name + ', batch of ' + str(n):>28}: {elapsed * 1e6:10.2f} us/query  ({loop_time / elapsed:.0f}x)")
+
+
+if __name__ == "__main__":
+    # Random services; test_capacity.py asserts that every answer meets its target and that
+    # one server fewer misses it
+    rng = np.random.default_rng(1)
+    arrival_rate = rng.uniform(1, 100, 1000)
+    service_rate = rng.uniform(1, 10, 1000)
+    target_time = rng.uniform(0.5, 3, 1000) / service_rate
+    servers = minimum_servers(arrival_rate, service_rate, target_time)
+    print("infeasible targets (below the service time):", np.sum(servers == 0))
+    print("servers needed: median", int(np.median(servers[servers > 0])), "max", servers.max())
+
+    for cv2 in (0, 1, 4):
+        scale = minimum_scale(arrival_rate, service_rate, target_time, service_cv2=cv2)
+        print(f"minimum_scale, cv^2 = {cv2}: E[T] - target at k is at most "
+              f"{np.max(np.abs(mg1(arrival_rate, scale * service_rate, cv2)['W'] - target_time)):.1e}")
+
+    # Part 2-3 of ProjectFive.py: lambda = 10 and mu = 20 scaled together, E[T] = 1 / (k * 10)
+    print("Part 2-3, smallest k with E[T] <= 0.025:", minimum_scale(10, 20, 0.025, scale_arrivals=True, integer=True))
+    print()
+    benchmark()
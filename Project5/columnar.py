@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+"""
+File: columnar.py
+
+Description:
+Simple on-disk columnar storage for long time series, such as the download rates of
+ProjectEight.py or the arrival and service times of ProjectFive.py (the Project 8 scripts import
+this module from the Project5 directory). A table is a directory with one standard NumPy .npy
+file per column, so it can also be inspected with plain np.load.
+
+Columns are opened with np.load(mmap_mode='r'): nothing is read until a slice is accessed, and
+iter_windows hands out consecutive slices of every column as views of the mapped files. An
+analysis therefore touches one window at a time and never copies a whole file into memory, and
+the operating system pages data in and out as needed.
+
+ColumnWriter appends chunks of rows to the column files when the final length is not known in
+advance. Each file starts with a .npy header padded to a fixed 128 bytes, which is rewritten
+with the real length when the writer is closed.
+
+Packages:
+The module only depends on NumPy.
+
+Components:
+- write_columns function: Saves a dict of equal-length arrays as a table.
+- ColumnWriter class: Appends chunks of rows to a table of unknown final length.
+- open_columns function: Memory-maps the columns of a table.
+- iter_windows function: Generator of consecutive windows (dicts of views) over the columns.
+
+Usage:
+Import the functions from another script, or run 'python3 columnar.py' to write a 10^8-row
+table and time a windowed pass over it.
+"""
+
+import os
+import struct
+import tempfile
+import time
+
+import numpy as np
+
+# Every column file written by ColumnWriter has a header of exactly this many bytes
+_HEADER_SIZE = 128
+
+# .npy version 1.0 header for a 1-D array, padded with spaces to _HEADER_SIZE bytes
+def _header(dtype, length):
+    header = repr({'descr': np.lib.format.dtype_to_descr(np.dtype(dtype)), 'fortran_order': False,
+                   'shape': (length,)})
+    header = header.ljust(_HEADER_SIZE - 11) + '\n'
+    # 10 bytes of magic string and length field precede the header text
+    if len(header) + 10 != _HEADER_SIZE:
+        raise ValueError(f"The .npy header for dtype {dtype} does not fit in {_HEADER_SIZE} bytes")
+    return np.lib.format.magic(1, 0) + struct.pack('<H', len(header)) + header.encode('latin1')
+
+def write_columns(directory, columns):
+    """Save columns (a dict of name: 1-D array, all the same length) to directory, one
+    .npy file per column. Existing columns with the same names are overwritten."""
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError("All columns must have the same length")
+    os.makedirs(directory, exist_ok=True)
+    for name, values in columns.items():
+        np.save(os.path.join(directory, name + '.npy'), np.asarray(values))
+
+class ColumnWriter:
+    """Writes a table chunk by chunk. dtypes = dict of column name: dtype
+    Use as a context manager, or call close() to write the final lengths:
+        with ColumnWriter(directory, {'time': float, 'rate': float}) as writer:
+            writer.append({'time': t, 'rate': r})"""
+
+    def __init__(self, directory, dtypes):
+        os.makedirs(directory, exist_ok=True)
+        self.dtypes = {name: np.dtype(dtype) for name, dtype in dtypes.items()}
+        self.length = 0
+        self._files = {}
+        for name, dtype in self.dtypes.items():
+            file = open(os.path.join(directory, name + '.npy'), 'wb')
+            file.write(_header(dtype, 0))
+            self._files[name] = file
+
+    def append(self, chunk):
+        """Append one chunk: a dict with an equal-length array for every column."""
+        lengths = {len(chunk[name]) for name in self.dtypes}
+        if len(lengths) > 1:
+            raise ValueError("All columns of a chunk must have the same length")
+        for name, dtype in self.dtypes.items():
+            np.ascontiguousarray(chunk[name], dtype=dtype.newbyteorder('<')).tofile(self._files[name])
+        self.length += lengths.pop()
+
+    def close(self):
+        """Write the final length into every header and close the files."""
+        for name, file in self._files.items():
+            file.seek(0)
+            file.write(_header(self.dtypes[name].newbyteorder('<'), self.length))
+            file.close()
+        self._files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def open_columns(directory, names=None):
+    """Memory-map the columns of a table read-only. names = columns to open (default: all).
+    Returns a dict of name: np.memmap; slicing it reads only the rows that are accessed."""
+    if names is None:
+        names = sorted(file[:-4] for file in os.listdir(directory) if file.endswith('.npy'))
+    columns = {name: np.load(os.path.join(directory, name + '.npy'), mmap_mode='r') for name in names}
+    if len({len(values) for values in columns.values()}) > 1:
+        raise ValueError(f"Columns in {directory} have different lengths")
+    return columns
+
+def iter_windows(columns, window=2**20):
+    """Yield dicts with the same keys as columns holding consecutive slices of window rows.
+    The slices are views, so no data is copied until the values are used."""
+    length = len(next(iter(columns.values()))) if columns else 0
+    for start in range(0, length, window):
+        yield {name: values[start:start + window] for name, values in columns.items()}
+
+
+if __name__ == "__main__":
+    directory = tempfile.mkdtemp()
+    rows, chunk = 10**8, 10**6
+
+    # Write two float64 columns (1.6 GB) in chunks, then reopen them memory-mapped
+    start = time.perf_counter()
+    with ColumnWriter(directory, {'time': float, 'value': float}) as writer:
+        for first in range(0, rows, chunk):
+            index = np.arange(first, first + chunk, dtype=float)
+            writer.append({'time': index, 'value': np.sin(index)})
+    print(f"Wrote {rows} rows in {time.perf_counter() - start:.1f} s "
+          f"({sum(os.path.getsize(os.path.join(directory, f)) for f in os.listdir(directory)) / 1e9:.1f} GB)")
+
+    columns = open_columns(directory)
+    print("np.load reads the headers back:", {name: values.shape for name, values in columns.items()})
+
+    # Windowed pass: only one window of each column is in memory at a time
+    start = time.perf_counter()
+    total, last_time = 0.0, None
+    for window in iter_windows(columns):
+        total += np.sum(window['value'])
+        last_time = window['time'][-1]
+    elapsed = time.perf_counter() - start
+    print(f"Windowed sum over {rows} rows: {total:.6f} (last time {last_time:.0f}) in {elapsed:.2f} s "
+          f"({rows / elapsed:.0f} rows/s)")
+
+    for name in columns:
+        os.remove(os.path.join(directory, name + '.npy'))
+    os.rmdir(directory)
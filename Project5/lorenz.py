@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+
+"""
+File: lorenz.py
+
+Description:
+Batched integrator for the Lorenz system. Instead of stepping a single trajectory with a Python
+loop and writing x, y and z into three separate arrays one element at a time, N trajectories are
+kept in one (N, 3) state array and advanced together with NumPy operations. Each trajectory may
+have its own s, r and b, so a whole parameter sweep can be integrated as a single batch.
+
+Besides the forward Euler stepper used by the original scripts, a classical fixed-step RK4 and an
+adaptive Dormand-Prince RK45 stepper with tolerance-driven step sizes are provided. Every run can
+report its step count and number of right-hand side evaluations, so accuracy can be compared
+against cost.
+
+Packages:
+The module only depends on NumPy, so it can be imported without loading Matplotlib.
+
+Components:
+- lorenz function: Computes the derivatives of the Lorenz system (works on scalars or arrays).
+- lorenz_batch function: Fixed-step (Euler or RK4) integration of N trajectories in lockstep.
+- lorenz_rk45 function: Adaptive Dormand-Prince integration with error control.
+- simulate_lorenz function: Headless entry point returning the time and x, y, z arrays of one run.
+- sweep_lorenz function: Runs a grid of r values and initial conditions across a process pool and
+  collects summary statistics (bounds, mean, final state, divergence rate) into columns.
+- benchmark function: Measures trajectories per second as the batch size grows.
+- compare_methods function: Prints cost (steps, RHS evaluations) against accuracy for each method.
+
+Usage:
+Import simulate_lorenz, lorenz_batch or sweep_lorenz from another script (plotting is left to the
+caller; ProjectSeven.py imports this module from the Project5 directory), or run
+'python3 lorenz.py' to check the batched integrator against the original per-step loop and
+print the benchmarks.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Function to compute derivatives of the Lorenz system
+def lorenz(x, y, z, s=10, r=28, b=2.667):
+    # Compute the derivatives
+    x_dot = s*(y - x)
+    y_dot = r*x - y - x*z
+    z_dot = x*y - b*z
+    return x_dot, y_dot, z_dot
+
+# Integration methods and the number of right-hand side evaluations per fixed step
+FIXED_STEP_METHODS = {'euler': 1, 'rk4': 4}
+
+# Butcher tableau of the Dormand-Prince 5(4) pair
+_DP_A = (
+    (),
+    (1/5,),
+    (3/40, 9/40),
+    (44/45, -56/15, 32/9),
+    (19372/6561, -25360/2187, 64448/6561, -212/729),
+    (9017/3168, -355/33, 46732/5247, 49/176, -5103/18656),
+    (35/384, 0, 500/1113, 125/192, -2187/6784, 11/84),
+)
+# Difference between the 5th and 4th order weights, used for the error estimate
+_DP_E = (71/57600, 0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40)
+
+# Derivatives of a (3, N) state array, returned as a (3, N) array
+def _derivatives(state, s, r, b):
+    return np.array(lorenz(state[0], state[1], state[2], s, r, b))
+
+# Function to integrate many Lorenz trajectories at once
+def lorenz_batch(initial, num_steps, dt=0.01, s=10, r=28, b=2.667, record=True, method='euler'):
+    """Advance N trajectories of the Lorenz system with fixed steps.
+    initial = (3,) initial condition or (N, 3) array of initial conditions
+    s, r, b = scalars shared by all trajectories or arrays of shape (N,)
+    record = if True return the full trajectory with shape (num_steps + 1, N, 3),
+    otherwise only the final (N, 3) state is returned. A (3,) initial condition drops
+    the batch axis from the result. A single trajectory (N = 1) is stepped with plain
+    Python floats, which is faster than NumPy for one row and gives the same values.
+    method = 'euler' (forward Euler, as in the original scripts) or 'rk4'"""
+    if method not in FIXED_STEP_METHODS:
+        raise ValueError(f"Unknown fixed-step method {method!r}, expected one of {list(FIXED_STEP_METHODS)}")
+    initial = np.asarray(initial, dtype=float)
+    single = initial.ndim == 1
+
+    # One trajectory: the scalar loop, NumPy's per-call overhead only pays off for N > 1
+    if initial.size == 3 and all(np.size(value) == 1 for value in (s, r, b)):
+        result = _single_trajectory(initial.ravel(), num_steps, dt, s, r, b, record, method)
+        return result if single else result[..., None, :]
+
+    # Keep x, y and z as contiguous rows of a (3, N) array
+    state = np.atleast_2d(initial).T.copy()
+    x, y, z = state
+
+    if record:
+        trajectory = np.empty((num_steps + 1, state.shape[1], 3))
+        trajectory[0] = state.T
+
+    # Iterate to compute the trajectories, one NumPy update per variable per step
+    for i in range(num_steps):
+        if method == 'euler':
+            x_dot, y_dot, z_dot = lorenz(x, y, z, s, r, b)
+            x += x_dot * dt
+            y += y_dot * dt
+            z += z_dot * dt
+        else:
+            k1 = _derivatives(state, s, r, b)
+            k2 = _derivatives(state + dt/2 * k1, s, r, b)
+            k3 = _derivatives(state + dt/2 * k2, s, r, b)
+            k4 = _derivatives(state + dt * k3, s, r, b)
+            state += (dt/6) * (k1 + 2*k2 + 2*k3 + k4)
+        if record:
+            trajectory[i + 1] = state.T
+
+    result = trajectory if record else state.T.copy()
+    return result[..., 0, :] if single else result
+
+# Fixed-step integration of a single trajectory with Python floats, in the same order of
+# operations as the batched kernel, so both give bit-for-bit identical results
+def _single_trajectory(initial, num_steps, dt, s, r, b, record, method):
+    x, y, z = (float(value) for value in initial)
+    s, r, b = (float(np.ravel(value)[0]) for value in (s, r, b))
+    trajectory = [(x, y, z)] if record else None
+    for _ in range(num_steps):
+        if method == 'euler':
+            x_dot, y_dot, z_dot = lorenz(x, y, z, s, r, b)
+            x += x_dot * dt
+            y += y_dot * dt
+            z += z_dot * dt
+        else:
+            k1 = lorenz(x, y, z, s, r, b)
+            k2 = lorenz(x + dt/2 * k1[0], y + dt/2 * k1[1], z + dt/2 * k1[2], s, r, b)
+            k3 = lorenz(x + dt/2 * k2[0], y + dt/2 * k2[1], z + dt/2 * k2[2], s, r, b)
+            k4 = lorenz(x + dt * k3[0], y + dt * k3[1], z + dt * k3[2], s, r, b)
+            x += (dt/6) * (k1[0] + 2*k2[0] + 2*k3[0] + k4[0])
+            y += (dt/6) * (k1[1] + 2*k2[1] + 2*k3[1] + k4[1])
+            z += (dt/6) * (k1[2] + 2*k2[2] + 2*k3[2] + k4[2])
+        if record:
+            trajectory.append((x, y, z))
+    return np.array(trajectory) if record else np.array([x, y, z])
+
+# Function to integrate Lorenz trajectories with adaptive step sizes
+def lorenz_rk45(initial, t_end, dt=0.01, s=10, r=28, b=2.667, rtol=1e-6, atol=1e-9, max_steps=1000000):
+    """Integrate from t = 0 to t_end with the embedded Dormand-Prince RK45 pair.
+    dt is only the first trial step; afterwards the step size is chosen so that the
+    estimated local error stays below atol + rtol * |state| for every trajectory in
+    the batch (all trajectories share the same steps).
+    Returns (t, trajectory, info) where t holds the accepted times, trajectory has
+    shape (len(t), N, 3) (or (len(t), 3) for a single initial condition) and info is a
+    dict with the number of accepted steps 'nst', rejected steps 'nrej' and
+    right-hand side evaluations 'nfe'."""
+    initial = np.asarray(initial, dtype=float)
+    single = initial.ndim == 1
+    state = np.atleast_2d(initial).T.copy()
+
+    times = [0.0]
+    states = [state.T.copy()]
+    t = 0.0
+    h = min(dt, t_end)
+    nst = nrej = 0
+
+    # First-same-as-last: the last stage of an accepted step is the first of the next
+    k = [_derivatives(state, s, r, b)]
+    nfe = 1
+
+    while t < t_end:
+        if nst + nrej >= max_steps:
+            raise RuntimeError(f"lorenz_rk45 exceeded max_steps={max_steps} before reaching t = {t_end}")
+        h = min(h, t_end - t)
+
+        # Stages 2 to 7 of the Dormand-Prince pair
+        k = k[:1]
+        for a in _DP_A[1:]:
+            k.append(_derivatives(state + h * sum(a_j * k_j for a_j, k_j in zip(a, k) if a_j), s, r, b))
+        nfe += 6
+        new_state = state + h * sum(a_j * k_j for a_j, k_j in zip(_DP_A[-1], k) if a_j)
+
+        # Scaled error norm of the embedded 4th order estimate
+        error = h * sum(e_j * k_j for e_j, k_j in zip(_DP_E, k) if e_j)
+        scale = atol + rtol * np.maximum(np.abs(state), np.abs(new_state))
+        error_norm = np.max(np.abs(error) / scale)
+
+        if error_norm <= 1:
+            t += h
+            state = new_state
+            k = [k[-1]]
+            nst += 1
+            times.append(t)
+            states.append(state.T.copy())
+        else:
+            k = [k[0]]
+            nrej += 1
+
+        # Standard step size controller with safety factor and growth limits
+        h *= 5.0 if error_norm == 0 else min(5.0, max(0.2, 0.9 * error_norm ** (-1/5)))
+
+    trajectory = np.array(states)
+    if single:
+        trajectory = trajectory[:, 0, :]
+    return np.array(times), trajectory, {'method': 'rk45', 'nst': nst, 'nrej': nrej, 'nfe': nfe}
+
+# Function to simulate the Lorenz system without plotting it
+def simulate_lorenz(r=28, s=10, b=2.667, initial=(0., 1., 1.05), dt=0.01, num_steps=10000,
+                    method='euler', rtol=1e-6, atol=1e-9, full_output=False):
+    """Integrate a single Lorenz trajectory and return the arrays (t, xs, ys, zs).
+    Nothing is plotted; see plot_trajectory in the project scripts for the optional
+    Matplotlib layer.
+    method = 'euler' or 'rk4' take num_steps fixed steps of size dt, 'rk45' integrates
+    to the same end time dt * num_steps with adaptive steps controlled by rtol and atol.
+    full_output = if True also return a dict with the step count 'nst' and number of
+    right-hand side evaluations 'nfe' (like odeint's infodict).
+    Fixed steps use the scalar single-trajectory loop directly, without the batch setup."""
+    if method == 'rk45':
+        t, trajectory, info = lorenz_rk45(initial, dt * num_steps, dt, s, r, b, rtol, atol)
+    else:
+        if method not in FIXED_STEP_METHODS:
+            raise ValueError(f"Unknown method {method!r}, expected 'rk45' or one of {list(FIXED_STEP_METHODS)}")
+        if np.size(initial) != 3 or any(np.size(value) != 1 for value in (s, r, b)):
+            raise ValueError("simulate_lorenz integrates one trajectory; use lorenz_batch for several")
+        trajectory = _single_trajectory(np.ravel(initial), num_steps, dt, s, r, b, True, method)
+        t = dt * np.arange(num_steps + 1)
+        info = {'method': method, 'nst': num_steps, 'nrej': 0,
+                'nfe': FIXED_STEP_METHODS[method] * num_steps}
+    xs, ys, zs = trajectory.T.copy()
+    if full_output:
+        return t, xs, ys, zs, info
+    return t, xs, ys, zs
+
+# Summary statistics of a batch of runs, computed in a worker process
+def _sweep_chunk(task):
+    r, initial, s, b, dt, num_steps, perturbation, renormalize_every = task
+    n = len(r)
+
+    # Integrate every run together with a twin displaced by the perturbation in x
+    twin = initial.copy()
+    twin[:, 0] += perturbation
+    state = np.concatenate((initial, twin))
+    r2 = np.concatenate((r, r))
+
+    lower = initial.copy()
+    upper = initial.copy()
+    total = initial.copy()
+    log_growth = np.zeros(n)
+
+    steps_done = 0
+    while steps_done < num_steps:
+        m = min(renormalize_every, num_steps - steps_done)
+        segment = lorenz_batch(state, m, dt, s, r2, b)
+        runs = segment[1:, :n]
+        lower = np.minimum(lower, runs.min(axis=0))
+        upper = np.maximum(upper, runs.max(axis=0))
+        total += runs.sum(axis=0)
+        state = segment[-1]
+        steps_done += m
+
+        # Benettin renormalisation: record the growth and pull the twin back to the
+        # initial separation along the current direction of divergence
+        separation = state[n:] - state[:n]
+        distance = np.linalg.norm(separation, axis=1)
+        distance = np.where(distance > 0, distance, perturbation)
+        log_growth += np.log(distance / perturbation)
+        state[n:] = state[:n] + separation * (perturbation / distance)[:, None]
+
+    return {
+        'min': lower,
+        'max': upper,
+        'mean': total / (num_steps + 1),
+        'final': state[:n].copy(),
+        'lyapunov': log_growth / (num_steps * dt),
+    }
+
+# Function to run a parameter sweep of the Lorenz system
+def sweep_lorenz(r_values, initial_conditions=((0., 1., 1.05),), s=10, b=2.667, dt=0.01,
+                 num_steps=10000, workers=None, chunk_size=64, perturbation=1e-8, renormalize_every=10):
+    """Run every combination of r_values and initial_conditions and return a dict of columns.
+    Runs are ordered r-major (all initial conditions for r_values[0] first) and split into
+    chunks of chunk_size runs that are integrated as batches, one chunk per pool task.
+    Results are reassembled in task order, so the output does not depend on workers.
+    workers = number of worker processes (None uses every CPU, 1 runs in this process)
+    Columns: 'r' and 'initial' describe the run; 'min', 'max', 'mean' and 'final' are
+    (M, 3) arrays over the trajectory; 'lyapunov' is the average exponential divergence
+    rate of a twin trajectory started perturbation away in x, renormalised every
+    renormalize_every steps (an estimate of the largest Lyapunov exponent).
+    s and b are shared by every run and must be scalars; only r is swept. num_steps and
+    renormalize_every must be at least 1. An empty grid returns empty columns."""
+    if np.ndim(s) or np.ndim(b):
+        raise ValueError("s and b must be scalars; sweep_lorenz only sweeps r")
+    if num_steps < 1 or renormalize_every < 1:
+        raise ValueError("num_steps and renormalize_every must be at least 1")
+    r_values = np.atleast_1d(np.asarray(r_values, dtype=float))
+    initial_conditions = np.asarray(initial_conditions, dtype=float).reshape(-1, 3)
+
+    # Cartesian product of the grid, r-major
+    r_column = np.repeat(r_values, len(initial_conditions))
+    initial_column = np.tile(initial_conditions, (len(r_values), 1))
+
+    tasks = [(r_column[i:i + chunk_size], initial_column[i:i + chunk_size], s, b, dt,
+              num_steps, perturbation, renormalize_every)
+             for i in range(0, len(r_column), chunk_size)]
+
+    if workers == 1 or not tasks:
+        chunks = [_sweep_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_sweep_chunk, tasks))
+
+    result = {'r': r_column, 'initial': initial_column}
+    if not chunks:
+        return {**result, 'min': np.empty((0, 3)), 'max': np.empty((0, 3)), 'mean': np.empty((0, 3)),
+                'final': np.empty((0, 3)), 'lyapunov': np.empty(0)}
+    for key in chunks[0]:
+        result[key] = np.concatenate([chunk[key] for chunk in chunks])
+    return result
+
+# Euler steps written element by element into x, y and z arrays, as the project scripts did;
+# the single-trajectory path must match it bit for bit
+def _euler_loop(initial, num_steps, dt=0.01, s=10, r=28, b=2.667):
+    xs = np.empty(num_steps + 1)
+    ys = np.empty(num_steps + 1)
+    zs = np.empty(num_steps + 1)
+    xs[0], ys[0], zs[0] = initial
+    for i in range(num_steps):
+        x_dot, y_dot, z_dot = lorenz(xs[i], ys[i], zs[i], s, r, b)
+        xs[i + 1] = xs[i] + (x_dot * dt)
+        ys[i + 1] = ys[i] + (y_dot * dt)
+        zs[i + 1] = zs[i] + (z_dot * dt)
+    return np.column_stack((xs, ys, zs))
+
+def benchmark(batch_sizes=(1, 10, 100, 1000, 10000), num_steps=2000):
+    """Print trajectories per second for the original loop and the batched integrator."""
+    rng = np.random.default_rng(0)
+
+    start = time.perf_counter()
+    _euler_loop((0., 1., 1.05), num_steps)
+    loop_rate = 1 / (time.perf_counter() - start)
+    print(f"{'per-step loop':>16}: N = {1:>6}  {loop_rate:12.1f} trajectories/s")
+
+    for n in batch_sizes:
+        initial = rng.uniform(-10, 10, size=(n, 3))
+        r = rng.uniform(0, 30, size=n)
+        start = time.perf_counter()
+        lorenz_batch(initial, num_steps, r=r, record=False)
+        rate = n / (time.perf_counter() - start)
+        print(f"{'batched':>16}: N = {n:>6}  {rate:12.1f} trajectories/s  ({rate / loop_rate:.1f}x)")
+
+def compare_methods(t_end=10.0, r=28):
+    """Print steps, RHS evaluations and final-state error of each method at time t_end,
+    measured against a tight-tolerance RK45 reference solution."""
+    initial = (0., 1., 1.05)
+    _, reference, _ = lorenz_rk45(initial, t_end, r=r, rtol=1e-12, atol=1e-12)
+    runs = [('euler', 0.01, {}), ('euler', 0.001, {}), ('rk4', 0.01, {}), ('rk4', 0.001, {}),
+            ('rk45', 0.01, {'rtol': 1e-6, 'atol': 1e-9}), ('rk45', 0.01, {'rtol': 1e-9, 'atol': 1e-12})]
+    print(f"{'method':>8} {'setting':>14} {'steps':>8} {'RHS evals':>10} {'error at t_end':>16}")
+    for method, dt, tolerances in runs:
+        num_steps = int(round(t_end / dt))
+        t, xs, ys, zs, info = simulate_lorenz(r=r, initial=initial, dt=dt, num_steps=num_steps,
+                                              method=method, full_output=True, **tolerances)
+        error = np.max(np.abs(np.array([xs[-1], ys[-1], zs[-1]]) - reference[-1]))
+        setting = f"rtol={tolerances['rtol']:.0e}" if tolerances else f"dt={dt}"
+        print(f"{method:>8} {setting:>14} {info['nst']:>8} {info['nfe']:>10} {error:>16.3e}")
+
+
+if __name__ == "__main__":
+    # The batched integrator must reproduce the original loop exactly for N = 1
+    for r in (28, 10, 0):
+        reference = _euler_loop((0., 1., 1.05), 10000, r=r)
+        batched = lorenz_batch((0., 1., 1.05), 10000, r=r)
+        print(f"r = {r:>2}: max difference from the per-step loop = {np.max(np.abs(batched - reference))}")
+
+    print("\nThroughput over 2000 Euler steps:")
+    benchmark()
+
+    print("\nCost against accuracy at t = 10 (r = 28):")
+    compare_methods()
+
+    print("\nParameter sweep of 256 r values (5000 Euler steps each):")
+    r_grid = np.linspace(0, 30, 256)
+    for workers in (1, None):
+        start = time.perf_counter()
+        summary = sweep_lorenz(r_grid, num_steps=5000, workers=workers)
+        print(f"workers = {str(workers):>4}: {time.perf_counter() - start:.2f} s")
+    for r, exponent in zip(summary['r'][::51], summary['lyapunov'][::51]):
+        print(f"r = {r:5.2f}: divergence rate = {exponent:7.3f}")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+"""
+File: queue_models.py
+
+Description:
+Analytic steady-state metrics of single-station queues, evaluated over NumPy arrays so that
+a whole grid of configurations is computed in a few array operations. Part 2-3 of
+ProjectFive.py uses the M/M/1 formulas for a system whose arrival rate lambda and service rate
+mu are both scaled by k; every function here takes the same scale factor.
+
+- M/M/c: the probability of waiting is Erlang C = B / (1 - rho * (1 - B)), where Erlang B with
+  offered load a = lambda / mu is the ratio of the Poisson(a) probability of c to the Poisson
+  probability of at most c. The cumulative probability is the regularized incomplete gamma
+  function Q(c + 1, a), and the probability of c is computed in log space, so B costs O(1) for
+  any number of servers instead of the O(c) recursion B(n) = a * B(n - 1) / (n + a * B(n - 1)).
+- M/G/1: the Pollaczek-Khinchine formula L_q = rho^2 * (1 + cv^2) / (2 * (1 - rho)), where cv^2
+  is the squared coefficient of variation of the service time. M/D/1 is cv^2 = 0 and M/M/1 is
+  cv^2 = 1.
+
+Every function broadcasts its arguments against each other and returns a dict of arrays with
+'utilization' (rho), 'throughput' (X), the mean number in the system 'L' (E[N]) and in the
+queue 'L_q', and the mean time in the system 'W' (E[T]) and in the queue 'W_q', matching
+queue_metrics in queue_sim.py. Unstable configurations (rho >= 1) get infinite L and W; with no
+arrivals (lambda = 0) nobody waits, so W_q = 0 and W = 1 / mu.
+
+Packages:
+The module uses NumPy and SciPy's 'gammaincc' and 'gammaln'.
+
+Components:
+- mm1 function: M/M/1 metrics.
+- mmc function: M/M/c metrics with the Erlang C probability of waiting ('p_wait').
+- md1 function: M/D/1 metrics.
+- mg1 function: M/G/1 metrics from the Pollaczek-Khinchine formula.
+- erlang_c function: Probability that an arrival waits in an M/M/c queue.
+- benchmark function: Configurations evaluated per second compared with list comprehensions.
+
+Usage:
+Import the functions from another script, or run 'python3 queue_models.py' to check the models
+against each other and print the benchmark.
+"""
+
+import time
+
+import numpy as np
+from scipy.special import gammaincc, gammaln
+
+# Metrics from the mean queue length, by Little's law
+def _metrics(arrival_rate, service_rate, servers, queue_length):
+    rho = arrival_rate / (servers * service_rate)
+    stable = rho < 1
+    L_q = np.where(stable, queue_length, np.inf)
+    # Without arrivals nobody waits: W_q takes its limit 0 as lambda -> 0, so W = 1 / mu
+    arriving = arrival_rate > 0
+    W_q = np.where(arriving, L_q / np.where(arriving, arrival_rate, 1), 0.0)
+    return {
+        'utilization': rho,
+        'throughput': np.where(stable, arrival_rate, servers * service_rate),
+        'L': L_q + arrival_rate / service_rate,
+        'L_q': L_q,
+        'W': W_q + 1 / service_rate,
+        'W_q': W_q,
+    }
+
+def erlang_c(arrival_rate, service_rate, servers):
+    """Probability that an arrival has to wait in an M/M/c queue (1 if rho >= 1).
+    servers = integer number of servers, a scalar or an array broadcast with the rates"""
+    arrival_rate, service_rate, servers = np.broadcast_arrays(np.asarray(arrival_rate, dtype=float),
+                                                              np.asarray(service_rate, dtype=float),
+                                                              np.asarray(servers, dtype=int))
+    if np.any(servers < 1):
+        raise ValueError("servers must be at least 1")
+    load = arrival_rate / service_rate
+
+    # Erlang B = P(Poisson(load) = c) / P(Poisson(load) <= c)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        erlang_b = np.exp(servers * np.log(load) - load - gammaln(servers + 1)) / gammaincc(servers + 1, load)
+        rho = load / servers
+        return np.where(rho < 1, erlang_b / (1 - rho * (1 - erlang_b)), 1.0)
+
+def mmc(arrival_rate, service_rate, servers, scale=1):
+    """M/M/c metrics with arrival and service rates both multiplied by scale.
+    The result also holds the probability of waiting 'p_wait'."""
+    arrival_rate = np.asarray(arrival_rate, dtype=float) * scale
+    service_rate = np.asarray(service_rate, dtype=float) * scale
+    p_wait = erlang_c(arrival_rate, service_rate, servers)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rho = arrival_rate / (servers * service_rate)
+        metrics = _metrics(arrival_rate, service_rate, servers, p_wait * rho / (1 - rho))
+    metrics['p_wait'] = p_wait
+    return metrics
+
+def mg1(arrival_rate, service_rate, service_cv2, scale=1):
+    """M/G/1 metrics (Pollaczek-Khinchine) for service times with mean 1 / service_rate and
+    squared coefficient of variation service_cv2 (variance * service_rate^2), with both rates
+    multiplied by scale."""
+    arrival_rate = np.asarray(arrival_rate, dtype=float) * scale
+    service_rate = np.asarray(service_rate, dtype=float) * scale
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rho = arrival_rate / service_rate
+        return _metrics(arrival_rate, service_rate, 1, rho**2 * (1 + np.asarray(service_cv2)) / (2 * (1 - rho)))
+
+def mm1(arrival_rate, service_rate, scale=1):
+    """M/M/1 metrics, as in Part 2-3 of ProjectFive.py: L = rho / (1 - rho) and
+    W = 1 / (k * (mu - lambda))."""
+    return mg1(arrival_rate, service_rate, 1, scale)
+
+def md1(arrival_rate, service_rate, scale=1):
+    """M/D/1 metrics (constant service time 1 / service_rate)."""
+    return mg1(arrival_rate, service_rate, 0, scale)
+
+def benchmark(size=10**6):
+    """Print configurations evaluated per second for M/M/1 with a list comprehension and with
+    mm1, and for M/M/c with 1 to 32 servers."""
+    rng = np.random.default_rng(0)
+    arrival_rate = rng.uniform(1, 100, size)
+    service_rate = rng.uniform(1, 100, size)
+    scale = rng.integers(1, 11, size)
+    servers = rng.integers(1, 33, size)
+
+    start = time.perf_counter()
+    [1 / (k * (mu - lam)) if lam < mu else float('inf')
+     for lam, mu, k in zip(arrival_rate.tolist(), service_rate.tolist(), scale.tolist())]
+    loop_rate = size / (time.perf_counter() - start)
+    print(f"{'M/M/1 E[T], list':>22}: {loop_rate:14.0f} configurations/s")
+
+    for name, model in (('M/M/1, all metrics', lambda: mm1(arrival_rate, service_rate, scale)),
+                        ('M/D/1, all metrics', lambda: md1(arrival_rate, service_rate, scale)),
+                        ('M/M/c, c <= 32', lambda: mmc(arrival_rate, service_rate, servers, scale))):
+        start = time.perf_counter()
+        model()
+        rate = size / (time.perf_counter() - start)
+        print(f"{name:>22}: {rate:14.0f} configurations/s  ({rate / loop_rate:.0f}x)")
+
+
+if __name__ == "__main__":
+    # Part 2-3 of ProjectFive.py: lambda = 10, mu = 20, k = 1 to 10
+    k_values = np.arange(1, 11, 1)
+    part3 = mm1(10, 20, k_values)
+    print("E[T] matches 1 / (k * (mu - lambda)):", np.allclose(part3['W'], 1 / (k_values * (20 - 10))))
+    print("E[N] matches rho / (1 - rho):", np.allclose(part3['L'], 0.5 / (1 - 0.5)))
+
+    # M/M/c with one server is M/M/1, and M/D/1 waits half as long as M/M/1
+    arrival_rate, service_rate = np.meshgrid(np.linspace(0.1, 9.9, 50), [10.0])
+    print("M/M/c with c = 1 matches M/M/1:",
+          all(np.allclose(mmc(arrival_rate, service_rate, 1)[key], mm1(arrival_rate, service_rate)[key])
+              for key in ('L', 'L_q', 'W', 'W_q')))
+    print("M/D/1 W_q is half of M/M/1:",
+          np.allclose(md1(arrival_rate, service_rate)['W_q'], mm1(arrival_rate, service_rate)['W_q'] / 2))
+
+    # Two servers against the closed form P(wait) = 2 * rho^2 / (1 + rho)
+    rho = arrival_rate / (2 * service_rate)
+    print("Erlang C for c = 2 matches 2 * rho^2 / (1 + rho):",
+          np.allclose(erlang_c(arrival_rate, service_rate, 2), 2 * rho**2 / (1 + rho)))
+    print("Unstable M/M/1 (lambda = mu):", mm1(10, 10)['W'])
+    print()
+    benchmark()
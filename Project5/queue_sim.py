@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+
+"""
+File: queue_sim.py
+
+Description:
+Discrete-event simulator for first-come-first-served queues with one (M/M/1) or several (M/M/k)
+servers. It replaces the hand-typed columns of Part 2-1 in ProjectFive.py: given arrival times
+and service durations it generates the service start times, exit times, time in queue and the
+number of customers in the queue and in the system seen by each arrival.
+
+The event calendar is a heap of server release events (the time each server next becomes free).
+Each arrival takes the server that frees up first, which is the head of the heap, so a customer
+costs one O(log k) heap operation. The simulation runs over the input in fixed-size chunks and
+stores every column in a NumPy array, which keeps 10^7 customers within a few seconds.
+
+For a single server the same columns follow from the Lindley recursion
+    exit[n] = max(arrival[n], exit[n - 1]) + service[n]
+which lindley evaluates without a Python loop: with C the cumulative service time,
+exit[n] = C[n] + max over j <= n of (arrival[j] - C[j - 1]), a running maximum. The input is
+processed in chunks so that the cumulative sums stay small and accurate for millions of jobs.
+queue_metrics then reduces any simulated table to L, L_q, W, W_q and utilization.
+lindley_columns applies the recursion to a table stored with columnar.py, one memory-mapped
+window at a time, for traces larger than the available memory.
+
+Packages:
+The module uses NumPy and columnar.py.
+
+Components:
+- simulate_queue function: FCFS simulation for given arrival times and service durations.
+- simulate_mmk function: Draws exponential interarrival and service times and simulates them.
+- lindley function: Vectorized single-server columns from the Lindley recursion.
+- queue_metrics function: Time-average L and L_q, mean W and W_q, and utilization of a table.
+- lindley_columns function: Lindley recursion and queue_metrics over an on-disk table.
+- benchmark function: Customers simulated per second for large M/M/k runs.
+- lindley_benchmark function: Jobs per second of lindley compared with simulate_queue.
+
+Usage:
+Import the functions from another script, or run 'python3 queue_sim.py' to reproduce the
+15-customer table of ProjectFive.py and print the benchmark. The table is checked in
+test_queue_sim.py.
+"""
+
+import heapq
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from columnar import ColumnWriter, iter_windows, open_columns
+
+def simulate_queue(arrival_times, service_durations, servers=1, chunk_size=65536):
+    """Simulate a first-come-first-served queue with the given number of servers.
+    arrival_times must be sorted. Returns a dict of NumPy columns, one entry per customer:
+    'arrival_times', 'service_durations', 'service_start_times', 'exit_times',
+    'time_in_queue', 'num_in_queue' and 'num_in_system' (both counted just before the
+    customer arrives, as in the Part 2-1 table), and 'server' (index of the server used)."""
+    arrival_times = np.asarray(arrival_times, dtype=float)
+    service_durations = np.asarray(service_durations, dtype=float)
+    if np.any(np.diff(arrival_times) < 0):
+        raise ValueError("arrival_times must be sorted")
+    n = len(arrival_times)
+
+    start_times = np.empty(n)
+    exit_times = np.empty(n)
+    server_used = np.empty(n, dtype=np.int32)
+
+    # Event calendar: (time the server becomes free, server index); ties go to the lowest index
+    calendar = [(0.0, server) for server in range(servers)]
+
+    for first in range(0, n, chunk_size):
+        last = min(first + chunk_size, n)
+        starts, exits, used = [], [], []
+        for arrival, duration in zip(arrival_times[first:last].tolist(), service_durations[first:last].tolist()):
+            free_at, server = calendar[0]
+            start = arrival if arrival > free_at else free_at
+            heapq.heapreplace(calendar, (start + duration, server))
+            starts.append(start)
+            exits.append(start + duration)
+            used.append(server)
+        start_times[first:last] = starts
+        exit_times[first:last] = exits
+        server_used[first:last] = used
+
+    columns = _table(arrival_times, service_durations, start_times, exit_times)
+    columns['server'] = server_used
+    return columns
+
+# Columns of the queue table, including the counts seen by each arrival
+def _table(arrival_times, service_durations, start_times, exit_times):
+    # Start times are non-decreasing under FCFS, so the customers that have started by
+    # arrival i are a prefix; the rest of the earlier customers are still waiting
+    index = np.arange(len(arrival_times))
+    started = np.searchsorted(start_times, arrival_times, side='right')
+    num_in_queue = np.maximum(index - started, 0)
+    sorted_exits = exit_times if np.all(exit_times[1:] >= exit_times[:-1]) else np.sort(exit_times)
+    left = np.searchsorted(sorted_exits, arrival_times, side='right')
+    num_in_system = np.maximum(index - left, 0)
+
+    return {
+        'arrival_times': arrival_times,
+        'service_durations': service_durations,
+        'service_start_times': start_times,
+        'exit_times': exit_times,
+        'time_in_queue': start_times - arrival_times,
+        'num_in_queue': num_in_queue,
+        'num_in_system': num_in_system,
+    }
+
+def lindley(arrival_times, service_durations, chunk_size=2**20, previous_exit=-np.inf):
+    """Single-server FCFS columns from the Lindley recursion, computed with cumulative
+    sums and running maxima instead of a per-job loop. arrival_times must be sorted.
+    previous_exit = exit time of the customer before the first one, to continue a trace
+    processed in pieces (the counting columns only include customers of this call).
+    Returns the same columns as simulate_queue, except 'server'."""
+    arrival_times = np.asarray(arrival_times, dtype=float)
+    service_durations = np.asarray(service_durations, dtype=float)
+    if np.any(np.diff(arrival_times) < 0):
+        raise ValueError("arrival_times must be sorted")
+    n = len(arrival_times)
+
+    start_times = np.empty(n)
+    exit_times = np.empty(n)
+    for first in range(0, n, chunk_size):
+        last = min(first + chunk_size, n)
+        arrivals = arrival_times[first:last]
+        services = service_durations[first:last]
+
+        # exit[n] = C[n] + max(previous_exit, max over j <= n of (arrival[j] - C[j - 1]))
+        cumulative = np.cumsum(services)
+        latest = np.maximum(np.maximum.accumulate(arrivals - (cumulative - services)), previous_exit)
+        exits = cumulative + latest
+
+        # Each job starts when it arrives or when the previous job leaves; the exits are the
+        # ones the recursion produced, so the next chunk continues from exactly these values
+        start_times[first:last] = np.maximum(arrivals, np.concatenate(([previous_exit], exits[:-1])))
+        exit_times[first:last] = exits
+        previous_exit = exits[-1]
+
+    return _table(arrival_times, service_durations, start_times, exit_times)
+
+def queue_metrics(columns, servers=1, horizon=None):
+    """Summary metrics of a simulated queue table (from simulate_queue or lindley).
+    horizon = length of the observation period starting at time 0; by default the run
+    ends when the last customer exits (15.27 for the Part 2-1 table).
+    Returns a dict with the time-average number in the system 'L' and in the queue 'L_q',
+    the mean time in the system 'W' and in the queue 'W_q', and 'utilization'."""
+    if horizon is None:
+        horizon = np.max(columns['exit_times'])
+    time_in_queue = columns['time_in_queue']
+    time_in_system = columns['exit_times'] - columns['arrival_times']
+    return {
+        'L': np.sum(time_in_system) / horizon,
+        'L_q': np.sum(time_in_queue) / horizon,
+        'W': np.mean(time_in_system),
+        'W_q': np.mean(time_in_queue),
+        'utilization': np.sum(columns['service_durations']) / (servers * horizon),
+    }
+
+def lindley_columns(source, target=None, window=2**20):
+    """Run the Lindley recursion over the 'arrival_times' and 'service_durations' columns of
+    a table written with columnar.py, one window of rows at a time. If target is given, the
+    'service_start_times', 'exit_times' and 'time_in_queue' columns are written there.
+    Returns the queue_metrics of the whole trace, accumulated window by window (all nan for
+    an empty table)."""
+    columns = open_columns(source, ['arrival_times', 'service_durations'])
+    writer = None
+    if target is not None:
+        writer = ColumnWriter(target, dict.fromkeys(['service_start_times', 'exit_times', 'time_in_queue'], float))
+
+    customers, queue_area, system_area, busy_time = 0, 0.0, 0.0, 0.0
+    previous_exit = -np.inf
+    for chunk in iter_windows(columns, window):
+        queue = lindley(chunk['arrival_times'], chunk['service_durations'], chunk_size=window,
+                        previous_exit=previous_exit)
+        previous_exit = queue['exit_times'][-1]
+        customers += len(queue['exit_times'])
+        queue_area += np.sum(queue['time_in_queue'])
+        system_area += np.sum(queue['exit_times'] - queue['arrival_times'])
+        busy_time += np.sum(queue['service_durations'])
+        if writer is not None:
+            writer.append(queue)
+    if writer is not None:
+        writer.close()
+
+    # An empty trace has no customers and no observation period, so no metric is defined
+    if customers == 0:
+        return dict.fromkeys(('L', 'L_q', 'W', 'W_q', 'utilization'), np.nan)
+    horizon = previous_exit
+    return {
+        'L': system_area / horizon,
+        'L_q': queue_area / horizon,
+        'W': system_area / customers,
+        'W_q': queue_area / customers,
+        'utilization': busy_time / horizon,
+    }
+
+def simulate_mmk(num_customers, arrival_rate, service_rate, servers=1, seed=None):
+    """Simulate an M/M/k queue: exponential interarrival times with rate arrival_rate and
+    exponential service times with rate service_rate per server. Returns the columns of
+    simulate_queue."""
+    rng = np.random.default_rng(seed)
+    arrival_times = np.cumsum(rng.exponential(1 / arrival_rate, num_customers))
+    service_durations = rng.exponential(1 / service_rate, num_customers)
+    return simulate_queue(arrival_times, service_durations, servers)
+
+def benchmark(sizes=(10**5, 10**6, 10**7), arrival_rate=10, service_rate=20):
+    """Print customers simulated per second and the simulated mean time in queue against
+    the M/M/1 and M/M/2 theory."""
+    for servers in (1, 2):
+        rho = arrival_rate / (servers * service_rate)
+        if servers == 1:
+            expected_wait = rho / (service_rate - arrival_rate)
+        else:
+            # Erlang C for two servers
+            p_wait = 2 * rho**2 / (1 + rho)
+            expected_wait = p_wait / (servers * service_rate - arrival_rate)
+        for n in sizes:
+            start = time.perf_counter()
+            queue = simulate_mmk(n, arrival_rate, service_rate, servers, seed=0)
+            elapsed = time.perf_counter() - start
+            print(f"M/M/{servers}, {n:>9} customers: {elapsed:6.2f} s ({n / elapsed:10.0f} customers/s), "
+                  f"mean time in queue {queue['time_in_queue'].mean():.4f} (theory {expected_wait:.4f})")
+
+def lindley_benchmark(sizes=(10**5, 10**6, 10**7), arrival_rate=10, service_rate=20):
+    """Print jobs per second of lindley and simulate_queue for single-server traces."""
+    rng = np.random.default_rng(0)
+    for n in sizes:
+        arrival_times = np.cumsum(rng.exponential(1 / arrival_rate, n))
+        service_durations = rng.exponential(1 / service_rate, n)
+
+        start = time.perf_counter()
+        vectorized = lindley(arrival_times, service_durations)
+        lindley_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        simulated = simulate_queue(arrival_times, service_durations)
+        simulate_time = time.perf_counter() - start
+
+        difference = np.max(np.abs(vectorized['exit_times'] - simulated['exit_times']))
+        print(f"{n:>9} jobs: lindley {n / lindley_time:12.0f} jobs/s, simulate_queue {n / simulate_time:10.0f} jobs/s "
+              f"({simulate_time / lindley_time:.0f}x), max exit time difference {difference:.1e}")
+
+
+if __name__ == "__main__":
+    # The 15-customer table from Part 2-1 of ProjectFive.py (test_queue_sim.py checks every
+    # column of it against simulate_queue and lindley)
+    arrival_times = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])
+    service_durations = np.array([2.22, 1.76, 2.13, 0.14, 0.76, 0.70, 0.47, 0.22, 0.18, 2.41, 0.41, 0.46, 1.37, 0.27, 0.27])
+    queue = simulate_queue(arrival_times, service_durations)
+    print("Part 2-1 exit times:", np.round(queue['exit_times'], 2).tolist())
+    print(queue_metrics(queue))
+    print()
+    benchmark()
+    print()
+    lindley_benchmark()
+
+    # 10^7 customers stored on disk and processed in memory-mapped windows
+    directory = tempfile.mkdtemp()
+    rng = np.random.default_rng(0)
+    with ColumnWriter(directory, {'arrival_times': float, 'service_durations': float}) as writer:
+        last_arrival = 0.0
+        for _ in range(10):
+            arrivals = last_arrival + np.cumsum(rng.exponential(1 / 10, 10**6))
+            last_arrival = arrivals[-1]
+            writer.append({'arrival_times': arrivals, 'service_durations': rng.exponential(1 / 20, 10**6)})
+    start = time.perf_counter()
+    metrics = lindley_columns(directory, os.path.join(directory, 'results'))
+    print(f"\nOn disk, {writer.length} customers: {time.perf_counter() - start:.2f} s, "
+          f"W_q = {metrics['W_q']:.4f} (theory {0.5 / (20 - 10):.4f}), utilization = {metrics['utilization']:.4f}")
+    shutil.rmtree(directory)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+"""
+File: queue_stream.py
+
+Description:
+Streaming, time-weighted statistics for a live FCFS queue. ProjectFive.py computes L_q_A as the
+mean of the number in queue seen by each arrival, which samples the queue per customer rather
+than over time. QueueStatistics instead consumes a log of (timestamp, event) records, where the
+event is 'arrival', 'start' (service begins) or 'exit', and integrates the number in the system,
+the number in the queue and the number of busy servers over time. Only the current counts and
+the running areas are kept, so the memory use does not grow with the length of the log.
+
+From the areas it reports the time-average L, L_q and utilization, and W and W_q by Little's
+law (area / number of arrivals), which is exact whenever the system is empty at both ends of
+the observed period. With a window, the areas are also kept in a ring of equal-width buckets,
+so the statistics of the last window seconds are available at any time in O(buckets) memory.
+
+Packages:
+The module only depends on NumPy and the simulator in queue_sim.py for the example.
+
+Components:
+- QueueStatistics class: Accumulator of time-weighted queue statistics, optionally over a sliding window.
+- events_from_table function: Generator of (timestamp, event) records for a simulated queue table.
+- read_events function: Generator of (timestamp, event) records from a 'timestamp,event' CSV log.
+
+Usage:
+Import the functions from another script, or run 'python3 queue_stream.py' to check the
+statistics against the Part 2-1 table and print the events processed per second.
+"""
+
+import heapq
+import time
+from collections import deque
+
+import numpy as np
+
+# Index of each area in a bucket: [start time, system area, queue area, busy area, arrivals, exits]
+_START, _SYSTEM, _QUEUE, _BUSY, _ARRIVALS, _EXITS = range(6)
+
+class QueueStatistics:
+    """Time-weighted statistics of a queue fed one (timestamp, event) record at a time.
+    servers = number of servers, used for the utilization
+    window = optional length of the sliding window in the same units as the timestamps;
+    it is divided into buckets equal parts, and the window statistics cover the last
+    window to window * (1 + 1 / buckets) time units
+    start = time at which observation begins (the queue is assumed empty then)"""
+
+    def __init__(self, servers=1, window=None, buckets=60, start=0.0):
+        self.servers = servers
+        self.window = window
+        self.in_system = 0
+        self.in_queue = 0
+        self.busy = 0
+        self.now = float(start)
+        self._total = [self.now, 0.0, 0.0, 0.0, 0, 0]
+        if window is not None:
+            self._width = window / buckets
+            self._buckets = deque([[self.now, 0.0, 0.0, 0.0, 0, 0]], maxlen=buckets + 1)
+
+    def advance(self, timestamp):
+        """Integrate the current counts up to timestamp without recording an event."""
+        if timestamp < self.now:
+            raise ValueError(f"Event at {timestamp} is earlier than the previous event at {self.now}")
+        self._add_areas(self._total, timestamp - self.now)
+        if self.window is not None:
+            # Split the interval at bucket boundaries; after a full window of idle buckets
+            # the older ones would be evicted anyway, so jump straight to the last window
+            bucket = self._buckets[-1]
+            while timestamp >= bucket[_START] + self._width:
+                end = bucket[_START] + self._width
+                self._add_areas(bucket, end - max(self.now, bucket[_START]))
+                if timestamp - end > self._width * self._buckets.maxlen:
+                    skipped = int((timestamp - end) // self._width) - self._buckets.maxlen
+                    end += skipped * self._width
+                bucket = [end, 0.0, 0.0, 0.0, 0, 0]
+                self._buckets.append(bucket)
+                self.now = end
+            self._add_areas(bucket, timestamp - max(self.now, bucket[_START]))
+        self.now = float(timestamp)
+
+    def _add_areas(self, bucket, duration):
+        bucket[_SYSTEM] += self.in_system * duration
+        bucket[_QUEUE] += self.in_queue * duration
+        bucket[_BUSY] += self.busy * duration
+
+    def update(self, timestamp, event):
+        """Record one event: 'arrival', 'start' or 'exit'."""
+        self.advance(timestamp)
+        if event == 'arrival':
+            self.in_system += 1
+            self.in_queue += 1
+            counter = _ARRIVALS
+        elif event == 'start':
+            self.in_queue -= 1
+            self.busy += 1
+            return
+        elif event == 'exit':
+            self.in_system -= 1
+            self.busy -= 1
+            counter = _EXITS
+        else:
+            raise ValueError(f"Unknown event {event!r}, expected 'arrival', 'start' or 'exit'")
+        self._total[counter] += 1
+        if self.window is not None:
+            self._buckets[-1][counter] += 1
+
+    def consume(self, records):
+        """Record every (timestamp, event) pair of an iterable, such as read_events(path).
+        Returns self, so the metrics can be read directly."""
+        for timestamp, event in records:
+            self.update(timestamp, event)
+        return self
+
+    def metrics(self, windowed=False):
+        """Statistics from the start of observation (or over the sliding window if windowed)
+        up to the last event. Returns a dict with 'L', 'L_q', 'W', 'W_q', 'utilization',
+        'throughput' (exits per time unit), 'arrivals', 'exits' and 'elapsed'."""
+        if not windowed:
+            areas = self._total
+        elif self.window is None:
+            raise ValueError("QueueStatistics was created without a window")
+        else:
+            areas = [self._buckets[0][_START]] + [sum(bucket[i] for bucket in self._buckets)
+                                                  for i in range(_SYSTEM, _EXITS + 1)]
+        elapsed = self.now - areas[_START]
+        arrivals = areas[_ARRIVALS]
+        return {
+            'L': areas[_SYSTEM] / elapsed if elapsed else 0.0,
+            'L_q': areas[_QUEUE] / elapsed if elapsed else 0.0,
+            'W': areas[_SYSTEM] / arrivals if arrivals else 0.0,
+            'W_q': areas[_QUEUE] / arrivals if arrivals else 0.0,
+            'utilization': areas[_BUSY] / (self.servers * elapsed) if elapsed else 0.0,
+            'throughput': areas[_EXITS] / elapsed if elapsed else 0.0,
+            'arrivals': arrivals,
+            'exits': areas[_EXITS],
+            'elapsed': elapsed,
+        }
+
+def events_from_table(columns):
+    """Yield the (timestamp, event) records of a queue table from queue_sim.py in time order.
+    At equal times arrivals come first, then service starts, then exits. Every customer's
+    own events follow that order, so the counts never go negative, even for a zero service
+    time (the number busy may briefly exceed servers when one customer leaves as the next
+    starts, which adds no area)."""
+    def stream(column, order, event):
+        for timestamp in np.sort(columns[column]).tolist():
+            yield timestamp, order, event
+
+    streams = (stream('arrival_times', 0, 'arrival'), stream('service_start_times', 1, 'start'),
+               stream('exit_times', 2, 'exit'))
+    for timestamp, _, event in heapq.merge(*streams):
+        yield timestamp, event
+
+def read_events(path):
+    """Yield (timestamp, event) records from a text log with one 'timestamp,event' line per
+    event. Blank lines and a header line are skipped."""
+    with open(path) as file:
+        for line in file:
+            timestamp, _, event = line.strip().partition(',')
+            if not timestamp or timestamp[0].isalpha():
+                continue
+            yield float(timestamp), event.strip()
+
+
+if __name__ == "__main__":
+    from queue_sim import queue_metrics, simulate_mmk, simulate_queue
+
+    # The 15-customer table from Part 2-1 of ProjectFive.py
+    arrival_times = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])
+    service_durations = np.array([2.22, 1.76, 2.13, 0.14, 0.76, 0.70, 0.47, 0.22, 0.18, 2.41, 0.41, 0.46, 1.37, 0.27, 0.27])
+    queue = simulate_queue(arrival_times, service_durations)
+    streamed = QueueStatistics().consume(events_from_table(queue)).metrics()
+    print(f"L_q sampled per arrival: {np.mean(queue['num_in_queue']):.4f}, time-weighted: {streamed['L_q']:.4f}")
+    for name, expected in queue_metrics(queue).items():
+        print(f"{name:>12}: streamed {streamed[name]:.6f}, from the table {expected:.6f}")
+    print()
+
+    # Events per second on an M/M/2 run, with a sliding window of the last 100 time units
+    queue = simulate_mmk(10**6, arrival_rate=10, service_rate=6, servers=2, seed=0)
+    statistics = QueueStatistics(servers=2, window=100)
+    start = time.perf_counter()
+    statistics.consume(events_from_table(queue))
+    elapsed = time.perf_counter() - start
+    events = 3 * len(queue['arrival_times'])
+    print(f"{events} events in {elapsed:.2f} s ({events / elapsed:.0f} events/s)")
+    overall, recent = statistics.metrics(), statistics.metrics(windowed=True)
+    expected = queue_metrics(queue, servers=2)
+    for name in ('L', 'L_q', 'W', 'W_q', 'utilization'):
+        print(f"{name:>12}: whole run {overall[name]:.4f} (table {expected[name]:.4f}), "
+              f"last {recent['elapsed']:.1f} time units {recent[name]:.4f}")
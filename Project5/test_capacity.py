@@ -0,0 +1,41 @@
+"""Capacity planner checks: each answer from minimum_servers and minimum_scale must meet the
+mean-time target, and one unit less capacity must miss it."""
+
+import numpy as np
+import pytest
+
+from capacity import _minimum_servers_by_enumeration, minimum_scale, minimum_servers
+from queue_models import mg1, mm1, mmc
+
+@pytest.fixture
+def services():
+    rng = np.random.default_rng(1)
+    service_rate = rng.uniform(1, 10, 1000)
+    return rng.uniform(1, 100, 1000), service_rate, rng.uniform(0.5, 3, 1000) / service_rate
+
+def test_minimum_servers_is_the_smallest_that_meets_the_target(services):
+    arrival_rate, service_rate, target_time = services
+    servers = minimum_servers(arrival_rate, service_rate, target_time)
+    met = servers > 0
+    np.testing.assert_array_equal(~met, target_time <= 1 / service_rate)
+    assert np.all(mmc(arrival_rate[met], service_rate[met], servers[met])['W'] <= target_time[met])
+    fewer = servers > 1
+    assert np.all(mmc(arrival_rate[fewer], service_rate[fewer], servers[fewer] - 1)['W'] > target_time[fewer])
+
+def test_minimum_servers_matches_enumeration(services):
+    arrival_rate, service_rate, target_time = (column[:200] for column in services)
+    feasible = target_time > 1 / service_rate
+    expected = [_minimum_servers_by_enumeration(*query) if ok else 0
+                for ok, *query in zip(feasible, arrival_rate, service_rate, target_time)]
+    np.testing.assert_array_equal(minimum_servers(arrival_rate, service_rate, target_time), expected)
+
+@pytest.mark.parametrize('cv2', [0, 1, 4])
+def test_minimum_scale_reaches_the_target_exactly(services, cv2):
+    arrival_rate, service_rate, target_time = services
+    scale = minimum_scale(arrival_rate, service_rate, target_time, service_cv2=cv2)
+    np.testing.assert_allclose(mg1(arrival_rate, scale * service_rate, cv2)['W'], target_time, rtol=1e-9)
+
+def test_minimum_scale_for_part3():
+    # lambda = 10 and mu = 20 scaled together: E[T] = 1 / (k * 10) <= 0.025 first holds at k = 4
+    assert minimum_scale(10, 20, 0.025, scale_arrivals=True, integer=True) == 4
+    assert mm1(10, 20, 4)['W'] <= 0.025 < mm1(10, 20, 3)['W']
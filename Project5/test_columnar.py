@@ -0,0 +1,25 @@
+"""Round trips through ColumnWriter and open_columns, and the fixed 128-byte .npy header that
+lets the writer patch in the final length."""
+
+import numpy as np
+import pytest
+
+from columnar import _HEADER_SIZE, ColumnWriter, _header, iter_windows, open_columns
+
+def test_writer_round_trip(tmp_path):
+    with ColumnWriter(tmp_path, {'time': float, 'count': np.int32}) as writer:
+        for first in range(0, 1000, 300):
+            index = np.arange(first, min(first + 300, 1000))
+            writer.append({'time': index * 0.5, 'count': index})
+    columns = open_columns(tmp_path)
+    np.testing.assert_array_equal(columns['time'], np.arange(1000) * 0.5)
+    assert columns['count'].dtype == np.int32
+    assert [len(window['time']) for window in iter_windows(columns, 400)] == [400, 400, 200]
+
+def test_header_has_fixed_size():
+    assert len(_header(float, 0)) == _HEADER_SIZE
+    assert len(_header(np.int64, 10**15)) == _HEADER_SIZE
+
+def test_header_that_does_not_fit_raises():
+    with pytest.raises(ValueError):
+        _header(np.dtype([(f'field{i}', float) for i in range(10)]), 1)
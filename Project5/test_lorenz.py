@@ -0,0 +1,56 @@
+"""The scalar single-trajectory path must agree bit for bit with the batched kernel and the
+original Euler loop; sweep_lorenz must reject inputs it cannot integrate."""
+
+import numpy as np
+import pytest
+
+from lorenz import _euler_loop, lorenz_batch, simulate_lorenz, sweep_lorenz
+
+def test_sweep_of_empty_grid_returns_empty_columns():
+    summary = sweep_lorenz([], num_steps=10, workers=1)
+    assert summary['r'].shape == (0,)
+    for key in ('initial', 'min', 'max', 'mean', 'final'):
+        assert summary[key].shape == (0, 3)
+    assert summary['lyapunov'].shape == (0,)
+
+def test_sweep_does_not_depend_on_workers():
+    r = np.linspace(0, 30, 7)
+    initial = ((0., 1., 1.05), (1., 1., 1.))
+    serial = sweep_lorenz(r, initial, num_steps=200, workers=1, chunk_size=3)
+    parallel = sweep_lorenz(r, initial, num_steps=200, workers=2, chunk_size=3)
+    assert serial['r'].shape == (14,)
+    for key in serial:
+        np.testing.assert_array_equal(serial[key], parallel[key])
+
+@pytest.mark.parametrize('options', [{'num_steps': 0}, {'num_steps': -5}, {'renormalize_every': 0}])
+def test_sweep_rejects_empty_integrations(options):
+    with pytest.raises(ValueError):
+        sweep_lorenz([10., 28.], workers=1, **{'num_steps': 10, **options})
+
+@pytest.mark.parametrize('s, b', [(np.array([10., 11.]), 2.667), (10, [2.667, 3.])])
+def test_sweep_rejects_array_s_and_b(s, b):
+    with pytest.raises(ValueError):
+        sweep_lorenz([10., 28.], s=s, b=b, num_steps=10, workers=1)
+
+@pytest.mark.parametrize('method', ['euler', 'rk4'])
+@pytest.mark.parametrize('r', [28, 10, 0])
+def test_single_trajectory_matches_batched_kernel(method, r):
+    initial = np.array([0., 1., 1.05])
+    single = lorenz_batch(initial, 2000, r=r, method=method)
+    # Two identical rows take the batched NumPy kernel
+    batched = lorenz_batch(np.stack((initial, initial)), 2000, r=r, method=method)
+    np.testing.assert_array_equal(single, batched[:, 0])
+    np.testing.assert_array_equal(lorenz_batch(initial[None], 2000, r=np.array([r]), method=method), batched[:, :1])
+    np.testing.assert_array_equal(lorenz_batch(initial, 2000, r=r, record=False, method=method), batched[-1, 0])
+
+def test_single_trajectory_matches_original_loop():
+    np.testing.assert_array_equal(lorenz_batch((0., 1., 1.05), 10000), _euler_loop((0., 1., 1.05), 10000))
+
+def test_simulate_lorenz_uses_the_original_euler_steps():
+    t, xs, ys, zs = simulate_lorenz(r=10, num_steps=5000)
+    np.testing.assert_array_equal(np.column_stack((xs, ys, zs)), _euler_loop((0., 1., 1.05), 5000, r=10))
+    assert t[-1] == pytest.approx(50)
+
+def test_simulate_lorenz_rejects_several_trajectories():
+    with pytest.raises(ValueError):
+        simulate_lorenz(r=[10, 28])
@@ -0,0 +1,27 @@
+"""Analytic queue metrics at the edges: no arrivals, the Part 2-3 closed form, and grids that
+mix stable and unstable configurations."""
+
+import numpy as np
+import pytest
+
+from queue_models import md1, mg1, mm1, mmc
+
+@pytest.mark.parametrize('model', [lambda: mm1(0, 20), lambda: md1(0, 20), lambda: mg1(0, 20, 2.5),
+                                   lambda: mmc(0, 20, 1), lambda: mmc(0, 20, 4)])
+def test_no_arrivals_means_no_waiting(model):
+    metrics = model()
+    assert metrics['W_q'] == 0
+    assert metrics['W'] == pytest.approx(1 / 20)
+    assert metrics['L'] == 0 and metrics['L_q'] == 0 and metrics['utilization'] == 0
+
+def test_part3_matches_closed_form():
+    k_values = np.arange(1, 11)
+    metrics = mm1(10, 20, k_values)
+    np.testing.assert_allclose(metrics['W'], 1 / (k_values * (20 - 10)))
+    np.testing.assert_allclose(metrics['L'], 1.0)
+
+def test_zero_arrivals_in_a_grid():
+    metrics = mmc(np.array([0.0, 10.0, 50.0]), 20, 2)
+    np.testing.assert_allclose(metrics['W'][:1], 1 / 20)
+    assert np.all(np.isfinite(metrics['W'][:2])) and np.isinf(metrics['W'][2])
+    np.testing.assert_allclose(mmc(10, 20, 1)['W'], mm1(10, 20)['W'])
@@ -0,0 +1,81 @@
+"""The simulators must reproduce the hand-built Part 2-1 table of ProjectFive.py and a
+brute-force FCFS reference, in memory and window by window on disk."""
+
+import math
+
+import numpy as np
+
+from columnar import write_columns
+from queue_sim import lindley, lindley_columns, queue_metrics, simulate_queue
+
+# The 15-customer table from Part 2-1 of ProjectFive.py
+ARRIVAL_TIMES = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])
+SERVICE_DURATIONS = np.array([2.22, 1.76, 2.13, 0.14, 0.76, 0.70, 0.47, 0.22, 0.18, 2.41, 0.41, 0.46,
+                              1.37, 0.27, 0.27])
+TABLE = {
+    'service_start_times': [1, 3.22, 4.98, 7.11, 7.25, 8.01, 8.71, 9.18, 9.4, 10.0, 12.41, 12.82, 13.28, 14.65, 15.0],
+    'exit_times': [3.22, 4.98, 7.11, 7.25, 8.01, 8.71, 9.18, 9.4, 9.58, 12.41, 12.82, 13.28, 14.65, 14.92, 15.27],
+    'time_in_queue': [0, 1.22, 1.98, 3.11, 2.25, 2.01, 1.71, 1.18, 0.4, 0, 1.41, 0.82, 0.28, 0.65, 0],
+    'num_in_queue': [0, 0, 1, 1, 1, 2, 3, 2, 1, 0, 0, 1, 0, 0, 0],
+    'num_in_system': [0, 1, 2, 2, 2, 3, 4, 3, 2, 0, 1, 2, 1, 1, 0],
+}
+
+def test_simulate_queue_reproduces_the_part2_table():
+    queue = simulate_queue(ARRIVAL_TIMES, SERVICE_DURATIONS)
+    for column, expected in TABLE.items():
+        np.testing.assert_allclose(queue[column], expected, atol=1e-9, err_msg=column)
+    assert np.all(queue['server'] == 0)
+    assert math.isclose(queue_metrics(queue)['W_q'], np.mean(TABLE['time_in_queue']))
+
+# Reference FCFS simulation: each customer takes the server that frees up first (lowest index on ties)
+def brute_force_exits(arrival_times, service_durations, servers):
+    free_at = [0.0] * servers
+    exits = []
+    for arrival, duration in zip(arrival_times, service_durations):
+        server = min(range(servers), key=lambda i: free_at[i])
+        free_at[server] = max(arrival, free_at[server]) + duration
+        exits.append(free_at[server])
+    return np.array(exits)
+
+def test_lindley_reproduces_the_part2_table():
+    queue = lindley(ARRIVAL_TIMES, SERVICE_DURATIONS)
+    for column, expected in TABLE.items():
+        np.testing.assert_allclose(queue[column], expected, atol=1e-9, err_msg=column)
+
+def test_simulators_match_brute_force():
+    rng = np.random.default_rng(1)
+    arrivals = np.cumsum(rng.exponential(1 / 10, 5000))
+    services = rng.exponential(1 / 6, 5000)
+    for servers in (1, 2, 3):
+        np.testing.assert_allclose(simulate_queue(arrivals, services, servers, chunk_size=777)['exit_times'],
+                                   brute_force_exits(arrivals, services, servers), rtol=1e-12)
+    np.testing.assert_allclose(lindley(arrivals, services * 3, chunk_size=777)['exit_times'],
+                               brute_force_exits(arrivals, services * 3, 1), rtol=1e-12)
+
+def test_lindley_continues_from_its_own_exits():
+    rng = np.random.default_rng(2)
+    arrivals = np.cumsum(rng.exponential(1 / 10, 3000))
+    services = rng.exponential(1 / 9, 3000)
+    queue = lindley(arrivals, services, chunk_size=1000)
+    # Each chunk starts from the last exit of the previous one, exactly
+    first = lindley(arrivals[:1000], services[:1000], chunk_size=1000)
+    rest = lindley(arrivals[1000:], services[1000:], chunk_size=1000, previous_exit=first['exit_times'][-1])
+    np.testing.assert_array_equal(queue['exit_times'], np.concatenate((first['exit_times'], rest['exit_times'])))
+    assert np.all(queue['service_start_times'] >= arrivals)
+    assert np.all(queue['service_start_times'][1:] >= queue['exit_times'][:-1])
+
+def test_lindley_columns_matches_in_memory_metrics(tmp_path):
+    rng = np.random.default_rng(0)
+    arrivals = np.cumsum(rng.exponential(1 / 10, 10000))
+    services = rng.exponential(1 / 12, 10000)
+    write_columns(tmp_path / 'source', {'arrival_times': arrivals, 'service_durations': services})
+    streamed = lindley_columns(tmp_path / 'source', tmp_path / 'target', window=999)
+    expected = queue_metrics(lindley(arrivals, services))
+    for key, value in expected.items():
+        assert math.isclose(streamed[key], value, rel_tol=1e-12)
+
+def test_lindley_columns_of_empty_table_is_nan(tmp_path):
+    write_columns(tmp_path, {'arrival_times': np.empty(0), 'service_durations': np.empty(0)})
+    metrics = lindley_columns(tmp_path)
+    assert set(metrics) == {'L', 'L_q', 'W', 'W_q', 'utilization'}
+    assert all(math.isnan(value) for value in metrics.values())
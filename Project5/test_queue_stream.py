@@ -0,0 +1,27 @@
+"""Streaming, time-weighted statistics against the finished table, including tied timestamps
+from zero service times."""
+
+import math
+
+import numpy as np
+
+from queue_sim import queue_metrics, simulate_queue
+from queue_stream import QueueStatistics, events_from_table
+
+def test_streamed_metrics_match_the_table():
+    arrival_times = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])
+    service_durations = np.array([2.22, 1.76, 2.13, 0.14, 0.76, 0.70, 0.47, 0.22, 0.18, 2.41, 0.41, 0.46,
+                                  1.37, 0.27, 0.27])
+    queue = simulate_queue(arrival_times, service_durations)
+    streamed = QueueStatistics().consume(events_from_table(queue)).metrics()
+    for name, expected in queue_metrics(queue).items():
+        assert math.isclose(streamed[name], expected, rel_tol=1e-12)
+
+def test_zero_service_times_never_give_negative_counts():
+    queue = simulate_queue([1.0, 1.0, 2.0, 2.5, 2.5], [0.0, 1.0, 0.0, 0.5, 0.0], servers=2)
+    statistics = QueueStatistics(servers=2)
+    for timestamp, event in events_from_table(queue):
+        statistics.update(timestamp, event)
+        assert statistics.in_system >= 0 and statistics.in_queue >= 0 and statistics.busy >= 0
+    assert statistics.in_system == statistics.in_queue == statistics.busy == 0
+    assert math.isclose(statistics.metrics()['L'], queue_metrics(queue)['L'], rel_tol=1e-12)
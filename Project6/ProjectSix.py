@@ -22,7 +22,8 @@ Packages:
 The script uses NumPy for numerical operations, SciPy's 'odeint' for solving differential equations, and Matplotlib for visualization. It visualizes the Taylor series approximations, the solution of the differential equation system, and the CPU temperature dynamics, highlighting the utility of mathematical models in understanding complex systems.
 
 Components:
-- Taylor series functions: Approximate given functions using Taylor series expansions.
+- Taylor series functions: Approximate given functions using Taylor series expansions (TaylorPolynomial objects from taylor.py).
+- solve_differential_equation function: Power series solution, using the cached coefficients and Horner evaluation of power_series.py.
 - A system of first-order differential equations solver: Models a second-order differential equation numerically.
 - cpu_temperature function: Calculates the rate of change in temperature due to workload and cooling efficiency.
 - Parameters setup: Defines constants and initial conditions for all parts.
@@ -42,19 +43,27 @@ import numpy as np
 from scipy.integrate import odeint
 import matplotlib.pyplot as plt
 from scipy.interpolate import interp1d
+from power_series import evaluate_series, part2_recurrence
+from taylor import TaylorPolynomial
 
 # Part 1: Taylor Series Expansion
 # ==================================================================================
 
+# Derivatives at x=0: y(0)=1, y'(0)=-1, y''(0)=0, y'''(0)=-2, y''''(0)=-2
+# Taylor polynomial: f(x) = 1 - x - 1/3*x^3 - 1/12*x^4
+part1_polynomial = TaylorPolynomial([1, -1, 0, -2, -2])
+
+# Given the derivatives and their values at x=3: y(3)=6, y'(3)=1, y''(3)=-11
+# Taylor polynomial: f(x) = 6 + (x - 3) - 11/2*(x - 3)^2
+part2_polynomial = TaylorPolynomial([6, 1, -11], center=3)
+
 def taylor_series_part1(x):
     """Taylor series up to n<=4 for the first part of the assignment."""
-    return 1 - x - (1/3)*x**3 - (1/12)*x**4
+    return part1_polynomial(x)
 
 def taylor_series_part2(x):
     """Second-order Taylor polynomial near x=3 for the second part of the assignment."""
-    # Given the derivatives and their values at x=3: y(3)=6, y'(3)=1, y''(3)=-11
-    # Taylor polynomial: f(x) = 6 + (x - 3) - 11/2*(x - 3)^2
-    return 6 + (x - 3) - 11/2 * (x - 3)**2
+    return part2_polynomial(x)
 
 # Evaluate and print the results for specific points
 x_part1 = 3.5
@@ -98,16 +107,11 @@ plt.show()
 
 # Part 2: Power Series
 # ==================================================================================
-def solve_differential_equation(x):
-    n = 8  # Solve for n <= 8
-    a = np.zeros(n+1)  # Coefficients
-    a[0] = 1  # Initial condition, y(0) = 1
-
-    for i in range(1, n+1):
-        a[i] = -a[i-2] / 4*((i-1) * (i))
-
-    y = sum(a[i] * x**i for i in range(n+1))
-    return y
+def solve_differential_equation(x, n=8):
+    """Power series solution of order n (n <= 8 for the assignment) with y(0) = 1.
+    The coefficients follow a[i] = -a[i-2] / 4*((i-1)*i); they are computed once per order and
+    cached, and the series is evaluated with Horner's method, so x may also be a NumPy array."""
+    return evaluate_series(part2_recurrence, x, order=n, initial=(1, 0))
 
 # Example usage
 x_value = 0
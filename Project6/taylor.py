@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+"""
+File: taylor.py
+
+Description:
+Taylor polynomials built from the derivative values of a function at an expansion point, as in
+Part 1 of ProjectSix.py. The coefficients f^(k)(c) / k! are computed once, when the polynomial is
+created, and stored in a NumPy array; evaluation uses Horner's method from power_series.py, so a
+whole array of x values costs one multiply-add per coefficient.
+
+The Lagrange form of the remainder bounds the truncation error of a degree-n polynomial:
+    |f(x) - P_n(x)| <= M * |x - c|^(n+1) / (n + 1)!
+where M bounds |f^(n+1)| between c and x. Given such a bound, terms_needed finds the smallest
+degree that meets a tolerance over an interval, so a caller can decide how many derivatives to
+supply before computing any of them. The coefficients are scaled by 1/k! formed by repeated
+division and the bounds are computed in log space, so k! is never formed and degrees in the
+hundreds (such as the ones terms_needed returns for wide intervals) do not overflow.
+
+Packages:
+The module only depends on NumPy and the Horner evaluation in power_series.py.
+
+Components:
+- TaylorPolynomial class: Taylor polynomial with vectorized evaluation and a Lagrange error bound.
+- terms_needed function: Smallest degree whose Lagrange bound meets a tolerance on an interval.
+
+Usage:
+Import the class from another script, or run 'python3 taylor.py' to check the Part 1 polynomials,
+the error bound and the evaluation speed.
+"""
+
+import math
+import time
+
+import numpy as np
+
+from power_series import horner
+
+class TaylorPolynomial:
+    """Taylor polynomial of degree len(derivatives) - 1 about center.
+    derivatives = [f(c), f'(c), f''(c), ...] at the expansion point c = center
+    Calling it evaluates the polynomial at a scalar or an array of x values."""
+
+    def __init__(self, derivatives, center=0.0):
+        derivatives = np.asarray(derivatives, dtype=float)
+        # 1 / k! by repeated division (1 / k! = 1 / (k - 1)! / k), which never forms k! itself
+        # and so stays finite (down to zero) for any degree
+        reciprocal_factorials = np.cumprod(np.concatenate(([1.0], 1 / np.arange(1, len(derivatives)))))
+        self.center = float(center)
+        self.coefficients = derivatives * reciprocal_factorials
+        self.coefficients.flags.writeable = False
+
+    @property
+    def degree(self):
+        return len(self.coefficients) - 1
+
+    def __call__(self, x):
+        return horner(self.coefficients, x, self.center)
+
+    def error_bound(self, x, derivative_bound):
+        """Lagrange bound on |f(x) - P(x)|, where derivative_bound bounds |f^(degree+1)|
+        between center and x. x may be an array."""
+        distance = np.abs(np.asarray(x, dtype=float) - self.center)
+        n = self.degree + 1
+        # M * d^n / n! in log space, so large degrees neither overflow nor lose the bound
+        with np.errstate(divide='ignore'):
+            return np.exp(np.log(derivative_bound) + n * np.log(distance) - math.lgamma(n + 1))
+
+    def __repr__(self):
+        return f"TaylorPolynomial(coefficients={self.coefficients.tolist()}, center={self.center})"
+
+def terms_needed(radius, tolerance, derivative_bound, max_degree=1000):
+    """Smallest degree n whose Lagrange bound M(n+1) * radius^(n+1) / (n+1)! is at most
+    tolerance for every x within radius of the center.
+    derivative_bound = constant bound M on all derivatives, or a function k -> bound on |f^(k)|
+    Raises ValueError if no degree up to max_degree is enough."""
+    k = np.arange(1, max_degree + 2)
+    if callable(derivative_bound):
+        bounds = np.array([derivative_bound(int(j)) for j in k], dtype=float)
+    else:
+        bounds = np.full(len(k), float(derivative_bound))
+    with np.errstate(divide='ignore'):
+        log_bound = np.log(bounds) + k * np.log(radius) - np.array([math.lgamma(j + 1) for j in k])
+    meets = np.flatnonzero(log_bound <= np.log(tolerance))
+    if len(meets) == 0:
+        raise ValueError(f"No degree up to {max_degree} reaches a tolerance of {tolerance}")
+    return int(k[meets[0]] - 1)
+
+
+if __name__ == "__main__":
+    # Part 1 of ProjectSix.py: the polynomials from their derivative values
+    part1 = TaylorPolynomial([1, -1, 0, -2, -2])
+    part2 = TaylorPolynomial([6, 1, -11], center=3)
+    x = np.linspace(-2, 5, 400)
+    print("Part 1 matches 1 - x - x^3/3 - x^4/12:", np.allclose(part1(x), 1 - x - x**3 / 3 - x**4 / 12))
+    print("Part 2 matches 6 + (x - 3) - 11/2 (x - 3)^2:", np.allclose(part2(x), 6 + (x - 3) - 11 / 2 * (x - 3)**2))
+    print(f"Part 1 at x = 3.5: {part1(3.5):.3f}")
+
+    # sin(x) on [-pi, pi]: every derivative is bounded by 1
+    degree = terms_needed(np.pi, 1e-10, 1)
+    sine = TaylorPolynomial([(0, 1, 0, -1)[k % 4] for k in range(degree + 1)])
+    x = np.linspace(-np.pi, np.pi, 10001)
+    print(f"sin on [-pi, pi] to 1e-10: degree {degree}, actual error {np.max(np.abs(sine(x) - np.sin(x))):.1e}, "
+          f"bound {np.max(sine.error_bound(x, 1)):.1e}")
+
+    # exp(x) on [-1, 1]: |f^(k)| <= e
+    degree = terms_needed(1, 1e-15, math.e)
+    exponential = TaylorPolynomial(np.ones(degree + 1))
+    x = np.linspace(-1, 1, 10001)
+    print(f"exp on [-1, 1] to 1e-15: degree {degree}, actual error {np.max(np.abs(exponential(x) - np.exp(x))):.1e}")
+
+    # Evaluation speed: term by term with ** against Horner, for 10^6 points
+    x = np.linspace(-2, 5, 10**6)
+    start = time.perf_counter()
+    1 - x - (1/3)*x**3 - (1/12)*x**4
+    expanded = time.perf_counter() - start
+    start = time.perf_counter()
+    part1(x)
+    nested = time.perf_counter() - start
+    print(f"Part 1 on 10^6 points: term by term {expanded * 1e3:.2f} ms, Horner {nested * 1e3:.2f} ms")
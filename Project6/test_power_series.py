@@ -0,0 +1,27 @@
+"""Part 2 coefficients as the original loop computed them, and the series of the odeint model
+against odeint itself."""
+
+import numpy as np
+from scipy.integrate import odeint
+
+from power_series import evaluate_series, model_recurrence, part2_recurrence, series_coefficients
+
+def test_part2_coefficients_match_the_original_loop():
+    for n in (2, 5, 8):
+        a = np.zeros(n + 1)
+        a[0] = 1
+        for i in range(1, n + 1):
+            a[i] = -a[i-2] / 4*((i-1) * (i))
+        np.testing.assert_array_equal(series_coefficients(part2_recurrence, n, (1.0, 0.0)), a)
+        x = np.linspace(-0.5, 0.5, 11)
+        np.testing.assert_allclose(evaluate_series(part2_recurrence, x, n), sum(a[i] * x**i for i in range(n + 1)),
+                                   rtol=1e-14, atol=1e-14)
+
+def test_model_series_matches_odeint():
+    def model(y, x):
+        y0, y1 = y
+        return [y1, (x - (x**2 + 4)*y0)/(x**2 + 4)]
+
+    x = np.linspace(0, 1.5, 151)
+    reference = odeint(model, [0, 1], x, rtol=1e-12, atol=1e-12)[:, 0]
+    np.testing.assert_allclose(evaluate_series(model_recurrence, x, 64, initial=(0, 1)), reference, atol=1e-10)
@@ -0,0 +1,37 @@
+"""TaylorPolynomial evaluation and Lagrange bounds, including degrees far past where k!
+overflows a float."""
+
+import numpy as np
+
+from taylor import TaylorPolynomial, terms_needed
+
+def sine_derivatives(degree):
+    return [(0, 1, 0, -1)[k % 4] for k in range(degree + 1)]
+
+def test_part1_and_part2_polynomials():
+    x = np.linspace(-2, 5, 400)
+    assert np.allclose(TaylorPolynomial([1, -1, 0, -2, -2])(x), 1 - x - x**3 / 3 - x**4 / 12)
+    assert np.allclose(TaylorPolynomial([6, 1, -11], center=3)(x), 6 + (x - 3) - 11 / 2 * (x - 3)**2)
+
+def test_degree_from_terms_needed_beyond_170():
+    # Degrees above 170 overflowed when k! was formed as a float
+    degree = terms_needed(80, 1e-10, 1)
+    assert degree > 170
+    sine = TaylorPolynomial(sine_derivatives(degree))
+    assert sine.degree == degree
+    assert np.all(np.isfinite(sine.coefficients))
+
+    values = sine(np.linspace(-80, 80, 101))
+    assert np.all(np.isfinite(values))
+    x = np.linspace(-3, 3, 101)
+    assert np.allclose(sine(x), np.sin(x), atol=1e-12)
+
+    bound = sine.error_bound(80, 1)
+    assert np.isfinite(bound) and bound <= 1e-10
+
+def test_error_bound_holds():
+    degree = terms_needed(np.pi, 1e-10, 1)
+    sine = TaylorPolynomial(sine_derivatives(degree))
+    x = np.linspace(-np.pi, np.pi, 1001)
+    assert np.all(np.abs(sine(x) - np.sin(x)) <= sine.error_bound(x, 1) + 1e-15)
+    assert sine.error_bound(0.0, 1) == 0.0
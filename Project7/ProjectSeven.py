@@ -6,42 +6,25 @@ File: ProjectSix.py
 Programmers: Owen Kroeger, Atu Ambala
 """
 
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D     # noqa: F401 unused import
 
+# The Lorenz integrator is shared with Project 5 (Project5/lorenz.py). This script is run
+# directly, so the Project5 directory is appended after this project's own directory, where
+# local modules take precedence.
+sys.path.append(os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Project5')))
+from lorenz import simulate_lorenz  # noqa: E402
+
 # ==================================================================================
 # Part 1: Lorenz System
 # ==================================================================================
 
-# Function to compute derivatives of the Lorenz system
-def lorenz(x, y, z, s=10, r=28, b=2.667):
-    # Compute the derivatives
-    x_dot = s*(y - x)
-    y_dot = r*x - y - x*z
-    z_dot = x*y - b*z
-    return x_dot, y_dot, z_dot
-
-# Function to simulate and plot the Lorenz system
-def plot_lorenz(r, title):
-    dt = 0.01
-    num_steps = 10000
-    
-    # Arrays to store the values of x, y, and z
-    xs = np.empty(num_steps + 1)
-    ys = np.empty(num_steps + 1)
-    zs = np.empty(num_steps + 1)
-    
-    # Initial conditions
-    xs[0], ys[0], zs[0] = (0., 1., 1.05)
-    
-    # Iterate to compute the trajectory
-    for i in range(num_steps):
-        x_dot, y_dot, z_dot = lorenz(xs[i], ys[i], zs[i], r=r)
-        xs[i + 1] = xs[i] + (x_dot * dt)
-        ys[i + 1] = ys[i] + (y_dot * dt)
-        zs[i + 1] = zs[i] + (z_dot * dt)
-    
+# Function to plot a simulated Lorenz trajectory
+def plot_trajectory(xs, ys, zs, title):
     # Create a figure for plotting
     fig = plt.figure(figsize=(10, 8))
     
@@ -80,6 +63,12 @@ def plot_lorenz(r, title):
     plt.subplots_adjust(top=0.9)
     plt.show()
 
+# Function to simulate and plot the Lorenz system
+def plot_lorenz(r, title):
+    # Compute the trajectory without any plotting, then draw it
+    t, xs, ys, zs = simulate_lorenz(r=r, initial=(0., 1., 1.05), dt=0.01, num_steps=10000)
+    plot_trajectory(xs, ys, zs, title)
+
 # Plot for each scenario
 plot_lorenz(28, "Chaotic")       # Plot for chaotic scenario
 plot_lorenz(10, "Semi-Chaotic")  # Plot for semi-chaotic scenario
@@ -88,7 +77,7 @@ plot_lorenz(0, "Non-Chaotic")    # Plot for non-chaotic scenario
 # ==================================================================================
 # Part 2: Lorenz System Models
 # ==================================================================================
-k
+
 # ------------------
 # Part 2 - 1
 # ------------------
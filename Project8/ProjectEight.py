@@ -2,8 +2,9 @@ import numpy as np
 import math
 from scipy.interpolate import CubicSpline
 import matplotlib.pyplot as plt
-from scipy.integrate import quad
 from mpl_toolkits.mplot3d import Axes3D     # noqa: F401 unused import
+from quadrature import integrate, integrate_adaptive
+from spline_integral import CumulativeIntegral
 
 # ----------------------------------------------
 # Part 1 - A
@@ -55,18 +56,18 @@ plt.show()
 def riemann_sum(n):
     a = 1
     b = math.e
-    delta_x = (b - a) / n
-    sum_result = 0
-    for i in range(1, n+1):
-        x_mid = a + ((2*i - 1) * delta_x) / 2
-        sum_result += math.log(x_mid) * delta_x
-    return sum_result
+    # Midpoint Riemann sum, evaluated over NumPy blocks instead of one subinterval at a time
+    return integrate(np.log, a, b, n, rule='midpoint')
 
 # Number of subintervals
 n = 1000000
 result = riemann_sum(n)
 print ("The Riemann sum approximation for the integral of ln(x) from 1 to e is:" ,result)
 
+# Adaptive Gauss-Kronrod quadrature reaches the same accuracy with far fewer evaluations
+result, error_estimate, evaluations = integrate_adaptive(np.log, 1, math.e, tol=1e-12)
+print(f"Adaptive quadrature: {result} (error estimate {error_estimate:.1e}, {evaluations} function evaluations instead of {n})")
+
 # ----------------------------------------------
 # Part 1 - C.2 
 # ----------------------------------------------
@@ -75,12 +76,8 @@ def f(x):
     return x**2 - x**3
 
 def riemann_sum2(n):
-    delta_x = 1 / n
-    sum_result = 0
-    for k in range(1, n+1):
-        x_k = -1 + k / n
-        sum_result += f(x_k) * delta_x
-    return sum_result
+    # Right-hand endpoint Riemann sum over [-1, 0], x_k = -1 + k / n for k = 1..n
+    return integrate(f, -1, 0, n, rule='right')
 
 # Number of subintervals
 n = 1000000
@@ -112,10 +109,14 @@ plt.legend()
 plt.grid(True)
 plt.show()
 
-# Numerical integration with increased subdivisions
-total_data_MB, error = quad(lambda t: R(t), 0, 30, limit=100)
+# Exact integration of the spline from its cumulative segment integrals
+R_integral = CumulativeIntegral(R)
+total_data_MB = R_integral.total(0, 30)
 total_data_MB *= 60  # Convert minutes to seconds
 
 # Print the corrected total data downloaded
 print(f"Total data downloaded over 30 minutes: {total_data_MB:.2f} MB")
-print(f"Estimation error of the integration: {error:.2e}")
+
+# Any other window is a range query, e.g. each 10-minute interval
+starts = np.array([0, 10, 20])
+print("Data downloaded in each 10-minute interval (MB):", np.round(R_integral.total(starts, starts + 10) * 60, 2))
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+
+"""
+File: quadrature.py
+
+Description:
+Quadrature engine for the Riemann sums of Part 1. Instead of looping over every subinterval in
+pure Python, the integrand is evaluated over NumPy arrays of nodes, one bounded-size block at a
+time. Memory use therefore depends only on the block size, so n = 10^9 subintervals run in
+constant memory. Left, right, midpoint, trapezoid and Simpson rules are supported.
+
+Each block is summed with NumPy's pairwise summation and the block partial sums are combined
+with math.fsum, which is exactly rounded. Blocks can also be spread over a process pool; because
+the block boundaries and the final reduction do not depend on the number of workers, the serial
+and parallel results are bit-for-bit identical.
+
+integrate_adaptive takes a tolerance instead of a subinterval count. It applies a 15-point
+Gauss-Kronrod rule with an embedded 7-point Gauss rule to each interval, and keeps bisecting
+the interval with the largest error estimate until the total estimate meets the tolerance,
+so the work goes only where the integrand needs it. It reports the error estimate and the
+number of function evaluations used.
+
+Packages:
+The module only depends on NumPy.
+
+Components:
+- integrate function: Composite quadrature with a selectable rule, evaluated block by block,
+  optionally in parallel worker processes.
+- integrate_adaptive function: Adaptive Gauss-Kronrod (G7-K15) quadrature with an error estimate.
+- benchmark function: Compares the original per-element loops with integrate.
+  (Running the module also prints the evaluations integrate_adaptive needs for several tolerances.)
+
+Usage:
+Import integrate or integrate_adaptive from another script, or run 'python3 quadrature.py' to
+print the benchmarks ('python3 quadrature.py --large' adds a 10^9-subinterval run). The checks
+of the rounding bound and of serial/parallel agreement are in test_quadrature.py.
+"""
+
+import heapq
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+RULES = ('left', 'right', 'midpoint', 'trapezoid', 'simpson')
+
+# Node positions (as multiples of delta_x from a) and weights of each rule for nodes start..stop-1
+def _block(rule, n, start, stop):
+    i = np.arange(start, stop, dtype=float)
+    if rule == 'left':
+        return i, None
+    if rule == 'right':
+        return i + 1, None
+    if rule == 'midpoint':
+        return i + 0.5, None
+    if rule == 'trapezoid':
+        weights = np.ones(stop - start)
+        weights[i == 0] = 0.5
+        weights[i == n] = 0.5
+        return i, weights
+    # Simpson: weights 1, 4, 2, 4, ..., 2, 4, 1 (times delta_x / 3)
+    weights = np.where(i % 2 == 1, 4.0, 2.0)
+    weights[i == 0] = 1.0
+    weights[i == n] = 1.0
+    return i, weights / 3
+
+# Pairwise partial sums of the weighted integrand values for a range of blocks
+def _block_sums(task):
+    f, a, delta_x, rule, n, num_nodes, block_size, first_block, last_block = task
+    sums = np.empty(last_block - first_block)
+    for j, block in enumerate(range(first_block, last_block)):
+        start = block * block_size
+        stop = min(start + block_size, num_nodes)
+        positions, weights = _block(rule, n, start, stop)
+        values = f(a + positions * delta_x)
+        sums[j] = np.sum(values if weights is None else values * weights)
+    return sums
+
+# Composite quadrature over n subintervals, evaluated in blocks
+def integrate(f, a, b, n, rule='midpoint', block_size=2**20, workers=1):
+    """Approximate the integral of f over [a, b] with n subintervals.
+    f must accept a NumPy array of x values (for example np.log or a polynomial).
+    rule = 'left', 'right', 'midpoint', 'trapezoid' or 'simpson' (n must be even)
+    block_size = number of nodes evaluated at once, which bounds the memory use
+    workers = number of worker processes (1 runs serially, None uses every CPU); f must
+    then be picklable, i.e. a NumPy ufunc or a module-level function, not a lambda.
+    Each block is summed pairwise and the block sums are added with math.fsum, so for
+    S = the sum of |weighted values| the rounding error of the sum is at most about
+    (log2(block_size) + 1) * 2.2e-16 * S * delta_x. The result depends only on
+    block_size, never on workers: serial and parallel runs agree exactly."""
+    if rule not in RULES:
+        raise ValueError(f"Unknown rule {rule!r}, expected one of {RULES}")
+    if rule == 'simpson' and n % 2:
+        raise ValueError("Simpson's rule needs an even number of subintervals")
+
+    delta_x = (b - a) / n
+    num_nodes = n + 1 if rule in ('trapezoid', 'simpson') else n
+    num_blocks = -(-num_nodes // block_size)
+
+    if workers == 1:
+        sums = _block_sums((f, a, delta_x, rule, n, num_nodes, block_size, 0, num_blocks))
+    else:
+        # A few tasks per worker to balance the load; results come back in block order
+        num_tasks = min(num_blocks, 4 * (workers or os.cpu_count()))
+        bounds = np.linspace(0, num_blocks, num_tasks + 1).astype(int)
+        tasks = [(f, a, delta_x, rule, n, num_nodes, block_size, bounds[i], bounds[i + 1])
+                 for i in range(num_tasks)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            sums = np.concatenate(list(pool.map(_block_sums, tasks)))
+    return math.fsum(sums) * delta_x
+
+# Gauss-Kronrod 15-point nodes on [-1, 1] (non-negative half) and their weights
+_XGK = np.array([0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+                 0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+                 0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+                 0.207784955007898467600689403773245, 0.0])
+_WGK = np.array([0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+                 0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+                 0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+                 0.204432940075298892414161999234649, 0.209482141084727828012999174891714])
+# Weights of the embedded 7-point Gauss rule, which uses every other Kronrod node
+_WG = np.array([0, 0.129484966168869693270611432679082, 0, 0.279705391489276667901467771423780,
+                0, 0.381830050505118944950369775488975, 0, 0.417959183673469387755102040816327])
+
+_GK_NODES = np.concatenate((-_XGK[:-1], _XGK[::-1]))
+_GK_WEIGHTS = np.concatenate((_WGK[:-1], _WGK[::-1]))
+_G_WEIGHTS = np.concatenate((_WG[:-1], _WG[::-1]))
+
+# Kronrod estimates and error estimates |K15 - G7| for an array of intervals
+def _gauss_kronrod(f, lower, upper):
+    center = (lower + upper) / 2
+    half_width = (upper - lower) / 2
+    values = f(center[:, None] + half_width[:, None] * _GK_NODES)
+    kronrod = half_width * (values @ _GK_WEIGHTS)
+    gauss = half_width * (values @ _G_WEIGHTS)
+    return kronrod, np.abs(kronrod - gauss)
+
+# Adaptive quadrature to a requested tolerance
+def integrate_adaptive(f, a, b, tol=1e-10, max_intervals=10000):
+    """Integrate f over [a, b] with globally adaptive Gauss-Kronrod quadrature.
+    f must accept a NumPy array of x values. The integrand is never evaluated at a or b,
+    so integrable endpoint singularities are allowed.
+    Returns (result, error_estimate, evaluations). If max_intervals is reached before
+    error_estimate <= tol, the best result so far is returned and error_estimate shows
+    how far it is from the target."""
+    value, error = _gauss_kronrod(f, np.array([float(a)]), np.array([float(b)]))
+    evaluations = len(_GK_NODES)
+
+    # Max-heap (by error) of the current intervals, and the exact partial sums of their errors
+    intervals = [(-error[0], float(a), float(b), value[0])]
+    error_partials = [float(error[0])]
+
+    # math.fsum of the partials is the correctly rounded total error of the current intervals,
+    # so the stopping test and the returned estimate are the same number
+    while math.fsum(error_partials) > tol and len(intervals) < max_intervals:
+        neg_error, lower, upper, _ = heapq.heappop(intervals)
+        middle = (lower + upper) / 2
+
+        # Bisect the worst interval, evaluating both halves in one call
+        values, errors = _gauss_kronrod(f, np.array([lower, middle]), np.array([middle, upper]))
+        evaluations += 2 * len(_GK_NODES)
+        heapq.heappush(intervals, (-errors[0], lower, middle, values[0]))
+        heapq.heappush(intervals, (-errors[1], middle, upper, values[1]))
+        for term in (neg_error, errors[0], errors[1]):
+            _add_exact(error_partials, float(term))
+
+    result = math.fsum(interval[3] for interval in intervals)
+    return result, math.fsum(error_partials), evaluations
+
+# Add x to a list of non-overlapping partial sums (Shewchuk's algorithm, which math.fsum also
+# uses), so that the partials always add up to the exact sum of everything added so far
+def _add_exact(partials, x):
+    i = 0
+    for y in partials:
+        if abs(x) < abs(y):
+            x, y = y, x
+        high = x + y
+        low = y - (high - x)
+        if low:
+            partials[i] = low
+            i += 1
+        x = high
+    partials[i:] = [x]
+
+# Riemann sums exactly as ProjectEight.py wrote them, one Python iteration per subinterval;
+# the benchmark reports the block-wise engine's speedup over these
+def _loop_riemann_sum(n):
+    a = 1
+    b = math.e
+    delta_x = (b - a) / n
+    sum_result = 0
+    for i in range(1, n+1):
+        x_mid = a + ((2*i - 1) * delta_x) / 2
+        sum_result += math.log(x_mid) * delta_x
+    return sum_result
+
+def _polynomial(x):
+    return x**2 - x**3
+
+def _loop_riemann_sum2(n):
+    delta_x = 1 / n
+    sum_result = 0
+    for k in range(1, n+1):
+        x_k = -1 + k / n
+        sum_result += _polynomial(x_k) * delta_x
+    return sum_result
+
+def benchmark(n=1000000):
+    """Print the results and run times of the original loops and of integrate."""
+    cases = [
+        ("ln(x) on [1, e], midpoint", _loop_riemann_sum, (np.log, 1, math.e, n, 'midpoint')),
+        ("x^2 - x^3 on [-1, 0], right", _loop_riemann_sum2, (_polynomial, -1, 0, n, 'right')),
+    ]
+    for name, loop, args in cases:
+        start = time.perf_counter()
+        expected = loop(n)
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = integrate(*args)
+        block_time = time.perf_counter() - start
+
+        print(f"{name} (n = {n}):")
+        print(f"    loop:      {expected:.15f}  {loop_time:.4f} s")
+        print(f"    integrate: {result:.15f}  {block_time:.4f} s  ({loop_time / block_time:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    benchmark()
+
+    # Every rule on the ln(x) integral, whose exact value is 1
+    for rule in RULES:
+        print(f"{rule:>10}: error = {integrate(np.log, 1, math.e, 1000, rule) - 1:.3e}")
+
+    # Adaptive quadrature: evaluations needed for a given tolerance
+    print(f"\n{'integrand':>10} {'tolerance':>10} {'estimate':>10} {'true error':>11} {'evaluations':>12}")
+    for name, function, a, b, exact in (("ln(x)", np.log, 1, math.e, 1.0),
+                                        ("sqrt(x)", np.sqrt, 0, 1, 2 / 3)):
+        for tol in (1e-6, 1e-10, 1e-14):
+            result, estimate, evaluations = integrate_adaptive(function, a, b, tol)
+            print(f"{name:>10} {tol:>10.0e} {estimate:>10.1e} {abs(result - exact):>11.1e} {evaluations:>12}")
+
+    # Constant memory: 10^9 midpoint subintervals in blocks of 2^20 nodes (about 20 s per run)
+    if '--large' in sys.argv:
+        for workers in (1, None):
+            start = time.perf_counter()
+            result = integrate(np.log, 1, math.e, 10**9, workers=workers)
+            print(f"n = 10^9, workers = {workers}: {result:.15f} in {time.perf_counter() - start:.1f} s")
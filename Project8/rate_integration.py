@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+
+"""
+File: rate_integration.py
+
+Description:
+Streaming integration of sampled transfer rates. Part 2 of ProjectEight.py fits one CubicSpline
+through all the per-minute rates and integrates it with quad, which needs every sample in memory
+and a refit whenever a sample arrives. RateIntegrator instead consumes the samples in chunks and
+keeps a running total per link, holding only the last two samples between chunks.
+
+Two rules are supported:
+- 'trapezoid': the rate is linear between samples, each segment adds h * (r0 + r1) / 2.
+- 'cubic': the rate is a piecewise cubic Hermite curve whose slope at each sample is the
+  derivative of the parabola through it and its two neighbours (second order on uneven
+  spacing). Each segment adds exactly h * (r0 + r1) / 2 + h^2 * (d0 - d1) / 12. A segment is
+  final as soon as the sample after it arrives, so the whole curve is never refit. Unlike the
+  global spline its curve depends only on nearby samples; on the Part 2 data the two totals
+  differ by a few hundredths of a percent.
+
+All links share the sample times; rates are given as an array with one column per link, so any
+number of links is integrated at once. The running totals use compensated (Kahan-Babuska)
+summation, so adding millions of segments does not accumulate rounding error.
+
+integrate_columns runs the integrator over a table stored with columnar.py (shared with Project 5),
+one memory-mapped window at a time, so traces larger than the available memory can be integrated.
+
+Packages:
+The module uses NumPy and Project5/columnar.py (SciPy for the comparison in the example).
+
+Components:
+- RateIntegrator class: Incremental integral of rate samples for one or more links.
+- integrate_columns function: Total of every rate column of an on-disk table, window by window.
+
+Usage:
+Import RateIntegrator from another script, or run 'python3 rate_integration.py' to compare it
+with the spline integral of ProjectEight.py and print the samples integrated per second.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+RATE_RULES = ('trapezoid', 'cubic')
+
+# The columnar storage module is shared with Project 5 (Project5/columnar.py). It is only
+# needed for on-disk tables, so the Project5 directory is appended to sys.path (after this
+# project's own directory) when a table is first used, not when this module is imported.
+def _columnar():
+    directory = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Project5'))
+    if directory not in sys.path:
+        sys.path.append(directory)
+    import columnar
+    return columnar
+
+class RateIntegrator:
+    """Running integral of rates sampled at increasing times.
+    rule = 'trapezoid' or 'cubic' (see the module description)
+    Feed chunks with update(times, rates), where rates has shape (n,) for one link or
+    (n, links); read the integral from the first sample to the latest one with total()."""
+
+    def __init__(self, rule='trapezoid'):
+        if rule not in RATE_RULES:
+            raise ValueError(f"Unknown rule {rule!r}, expected one of {RATE_RULES}")
+        self.rule = rule
+        self.samples = 0
+        self._sum = None
+        self._compensation = None
+        # Samples not yet integrated, and the slope at the first of them (cubic rule only)
+        self._times = np.empty(0)
+        self._rates = None
+        self._slope = None
+
+    def update(self, times, rates):
+        """Add a chunk of samples. times must continue the increasing sequence."""
+        times = np.asarray(times, dtype=float)
+        rates = np.asarray(rates, dtype=float)
+        if self._rates is None:
+            self._rates = np.empty((0,) + rates.shape[1:])
+            self._sum = np.zeros(rates.shape[1:])
+            self._compensation = np.zeros(rates.shape[1:])
+        times = np.concatenate((self._times, times))
+        rates = np.concatenate((self._rates, rates))
+        if np.any(np.diff(times) <= 0):
+            raise ValueError("Sample times must be strictly increasing")
+        self.samples += len(times) - len(self._times)
+
+        if self.rule == 'trapezoid':
+            done = len(times) - 1
+            step = self._widths(np.diff(times), rates)
+            self._add(np.sum(step * (rates[:-1] + rates[1:]), axis=0) / 2)
+        else:
+            # Segment i needs the slope at sample i + 1, which needs sample i + 2
+            done = len(times) - 2
+            if done < 1:
+                self._times, self._rates = times, rates
+                return
+            slopes = self._slopes(times, rates)
+            step = self._widths(np.diff(times[:-1]), rates)
+            self._add(np.sum(step * (rates[:-2] + rates[1:-1]) / 2
+                             + step**2 * (slopes[:-1] - slopes[1:]) / 12, axis=0))
+            self._slope = slopes[-1]
+        self._times, self._rates = times[done:], rates[done:]
+
+    def total(self):
+        """Integral from the first sample to the latest one (an array for several links).
+        For the cubic rule the last segment, whose right slope is not known yet, uses the
+        parabola through its end points with the known left slope."""
+        if self._sum is None:
+            raise ValueError("No samples have been added")
+        total = self._sum + self._compensation
+        if len(self._times) == 2:
+            h = self._times[1] - self._times[0]
+            r0, r1 = self._rates
+            if self._slope is None:
+                total = total + h * (r0 + r1) / 2
+            else:
+                # Parabola with slope d0 at t0 through r1: d1 = 2 * (r1 - r0) / h - d0
+                d0 = self._slope
+                d1 = 2 * (r1 - r0) / h - d0
+                total = total + h * (r0 + r1) / 2 + h**2 * (d0 - d1) / 12
+        return total
+
+    # Segment widths shaped to broadcast against the rate columns
+    @staticmethod
+    def _widths(widths, rates):
+        return widths.reshape(widths.shape + (1,) * (rates.ndim - 1))
+
+    # Slopes at samples 0..n-2: carried over (or one-sided at the very start), then central
+    def _slopes(self, times, rates):
+        h = self._widths(np.diff(times), rates)
+        h0, h1 = h[:-1], h[1:]
+        r0, r1, r2 = rates[:-2], rates[1:-1], rates[2:]
+        central = (h0**2 * (r2 - r1) + h1**2 * (r1 - r0)) / (h0 * h1 * (h0 + h1))
+        if self._slope is None:
+            first = (-(2 * h0[0] + h1[0]) / (h0[0] * (h0[0] + h1[0])) * r0[0]
+                     + (h0[0] + h1[0]) / (h0[0] * h1[0]) * r1[0]
+                     - h0[0] / (h1[0] * (h0[0] + h1[0])) * r2[0])
+        else:
+            first = self._slope
+        return np.concatenate(([first], central))
+
+    # Kahan-Babuska (Neumaier) compensated addition to the running sum
+    def _add(self, value):
+        total = self._sum + value
+        self._compensation += np.where(np.abs(self._sum) >= np.abs(value),
+                                       (self._sum - total) + value, (value - total) + self._sum)
+        self._sum = total
+
+def integrate_columns(directory, rate_columns, time_column='time', rule='trapezoid', window=2**20):
+    """Integrate rate columns of a table written with columnar.py over its time column.
+    rate_columns = names of the columns to integrate (one per link)
+    Returns a dict of column name: integral from the first sample to the last one."""
+    columnar = _columnar()
+    columns = columnar.open_columns(directory, [time_column] + list(rate_columns))
+    integrator = RateIntegrator(rule)
+    for chunk in columnar.iter_windows(columns, window):
+        integrator.update(chunk[time_column], np.column_stack([chunk[name] for name in rate_columns]))
+    return dict(zip(rate_columns, integrator.total()))
+
+
+if __name__ == "__main__":
+    from scipy.integrate import quad
+    from scipy.interpolate import CubicSpline
+
+    # Part 2 of ProjectEight.py: per-minute rates in MB/s over 30 minutes
+    times = np.arange(0, 31)
+    rates = np.array([24.5, 23.0, 25.5, 22.8, 22.7, 25.2, 24.7, 23.9, 25.1, 25.2, 25.4, 25.3, 24.8, 24.6, 25.7, 25.8,
+                      25.9, 24.9, 25.3, 25.5, 24.8, 23.6, 24.9, 25.1, 25.0, 25.2, 24.8, 24.2, 24.3, 25.4, 25.6])
+    spline = quad(CubicSpline(times, rates), 0, 30, limit=100)[0] * 60
+    for rule in RATE_RULES:
+        integrator = RateIntegrator(rule)
+        for start in range(0, 31, 4):
+            integrator.update(times[start:start + 4], rates[start:start + 4])
+        streamed = integrator.total() * 60
+        print(f"{rule:>10}: {streamed:.2f} MB streamed in chunks of 4, spline + quad {spline:.2f} MB "
+              f"({abs(streamed - spline) / spline:.1e} relative difference)")
+
+    # Convergence on a smooth rate with exact integral: r(t) = 25 + sin(t) on [0, 10]
+    exact = 250 + 1 - np.cos(10)
+    print(f"\n{'samples':>8} {'trapezoid error':>16} {'cubic error':>12}")
+    for n in (11, 101, 1001):
+        t = np.linspace(0, 10, n)
+        errors = [RateIntegrator(rule) for rule in RATE_RULES]
+        for integrator in errors:
+            integrator.update(t, 25 + np.sin(t))
+        print(f"{n:>8} {abs(errors[0].total() - exact):>16.2e} {abs(errors[1].total() - exact):>12.2e}")
+
+    # Throughput: 10^7 samples of 8 links with jittered sample times, in chunks of 10^5
+    rng = np.random.default_rng(0)
+    links, chunk, num_chunks = 8, 10**5, 100
+    for rule in RATE_RULES:
+        integrator = RateIntegrator(rule)
+        elapsed, now = 0.0, 0.0
+        for _ in range(num_chunks):
+            chunk_times = now + np.cumsum(rng.uniform(0.5, 1.5, chunk))
+            now = chunk_times[-1]
+            chunk_rates = 25 + rng.standard_normal((chunk, links))
+            start = time.perf_counter()
+            integrator.update(chunk_times, chunk_rates)
+            elapsed += time.perf_counter() - start
+        samples = integrator.samples * links
+        print(f"{rule:>10}: {samples} link samples in {elapsed:.2f} s ({samples / elapsed:.0f} samples/s), "
+              f"mean rate {np.mean(integrator.total()) / now:.4f}")
+
+    # The same kind of trace stored on disk and integrated through memory-mapped windows
+    directory = tempfile.mkdtemp()
+    names = [f'link{i}' for i in range(links)]
+    with _columnar().ColumnWriter(directory, dict.fromkeys(['time'] + names, float)) as writer:
+        now = 0.0
+        for _ in range(num_chunks):
+            chunk_times = now + np.cumsum(rng.uniform(0.5, 1.5, chunk))
+            now = chunk_times[-1]
+            writer.append({'time': chunk_times, **{name: 25 + rng.standard_normal(chunk) for name in names}})
+    start = time.perf_counter()
+    totals = integrate_columns(directory, names, rule='cubic')
+    elapsed = time.perf_counter() - start
+    print(f"on disk, {writer.length} rows x {links} links: {elapsed:.2f} s, "
+          f"mean rate {np.mean(list(totals.values())) / now:.4f}")
+    for name in ['time'] + names:
+        os.remove(os.path.join(directory, name + '.npy'))
+    os.rmdir(directory)
@@ -0,0 +1,58 @@
+"""Block-wise quadrature: serial and parallel sums agree exactly and stay within the rounding
+bound of the exactly rounded sum; the adaptive rule meets its tolerance."""
+
+import math
+
+import numpy as np
+import pytest
+
+from quadrature import RULES, _add_exact, _block, integrate, integrate_adaptive
+
+# Several blocks of 2^18 nodes plus a partial one; even so that Simpson's rule applies
+N = 3 * 2**18 + 12346
+BLOCK_SIZE = 2**18
+
+@pytest.mark.parametrize('rule', RULES)
+def test_serial_and_parallel_agree_exactly(rule):
+    serial = integrate(np.log, 1, math.e, N, rule, block_size=BLOCK_SIZE)
+    parallel = integrate(np.log, 1, math.e, N, rule, block_size=BLOCK_SIZE, workers=4)
+    assert serial == parallel
+
+@pytest.mark.parametrize('rule', RULES)
+def test_within_rounding_bound_of_exactly_rounded_sum(rule):
+    delta_x = (math.e - 1) / N
+    positions, weights = _block(rule, N, 0, N + 1 if rule in ('trapezoid', 'simpson') else N)
+    terms = np.log(1 + positions * delta_x) * (1 if weights is None else weights)
+    exact = math.fsum(terms) * delta_x
+    bound = (math.log2(BLOCK_SIZE) + 1) * 2.2e-16 * np.sum(np.abs(terms)) * delta_x
+    assert abs(integrate(np.log, 1, math.e, N, rule, block_size=BLOCK_SIZE) - exact) <= bound
+
+@pytest.mark.parametrize('rule, tolerance', [('left', 1e-3), ('right', 1e-3), ('midpoint', 1e-7),
+                                             ('trapezoid', 1e-6), ('simpson', 1e-12)])
+def test_rules_converge_to_exact_integral(rule, tolerance):
+    assert abs(integrate(np.log, 1, math.e, 1000, rule) - 1) <= tolerance
+
+def test_simpson_needs_even_n():
+    with pytest.raises(ValueError):
+        integrate(np.log, 1, math.e, 11, 'simpson')
+
+@pytest.mark.parametrize('function, a, b, exact', [(np.log, 1, math.e, 1.0), (np.sqrt, 0, 1, 2 / 3)])
+def test_adaptive_meets_tolerance(function, a, b, exact):
+    result, estimate, _ = integrate_adaptive(function, a, b, tol=1e-10)
+    assert estimate <= 1e-10
+    assert abs(result - exact) <= 1e-10
+
+def test_adaptive_estimate_is_the_exact_sum_that_stopped_the_loop():
+    # Over many tolerances the reported estimate always satisfies the test that ended the loop
+    for tol in np.geomspace(1e-13, 1e-3, 41):
+        result, estimate, _ = integrate_adaptive(lambda x: 1 / np.sqrt(x), 0, 1, tol=float(tol))
+        assert estimate <= tol
+        assert abs(result - 2) <= max(10 * tol, 1e-12)
+
+def test_exact_partial_sums_match_fsum():
+    rng = np.random.default_rng(0)
+    terms = (rng.standard_normal(5000) * 10.0**rng.integers(-20, 20, 5000)).tolist()
+    partials = []
+    for term in terms + [-term for term in terms[::2]]:
+        _add_exact(partials, term)
+    assert math.fsum(partials) == math.fsum(terms[1::2])
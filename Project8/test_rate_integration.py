@@ -0,0 +1,57 @@
+"""RateIntegrator must give the same totals however the samples are split into chunks, and
+integrate_columns must agree with feeding the same samples directly."""
+
+import sys
+
+import numpy as np
+import pytest
+
+from rate_integration import RATE_RULES, RateIntegrator, _columnar, integrate_columns
+
+@pytest.fixture
+def trace():
+    rng = np.random.default_rng(0)
+    times = np.cumsum(rng.uniform(0.5, 1.5, 1000))
+    return times, 25 + rng.standard_normal((1000, 3))
+
+@pytest.mark.parametrize('rule', RATE_RULES)
+def test_totals_do_not_depend_on_chunk_size(trace, rule):
+    times, rates = trace
+    whole = RateIntegrator(rule)
+    whole.update(times, rates)
+    for chunk in (1, 2, 3, 7, 128, 999):
+        integrator = RateIntegrator(rule)
+        for start in range(0, len(times), chunk):
+            integrator.update(times[start:start + chunk], rates[start:start + chunk])
+        assert integrator.samples == len(times)
+        np.testing.assert_allclose(integrator.total(), whole.total(), rtol=1e-13)
+
+def test_trapezoid_matches_numpy(trace):
+    times, rates = trace
+    integrator = RateIntegrator('trapezoid')
+    integrator.update(times, rates)
+    np.testing.assert_allclose(integrator.total(), np.trapezoid(rates, times, axis=0), rtol=1e-13)
+
+def test_cubic_is_exact_for_quadratic_rates():
+    times = np.sort(np.random.default_rng(1).uniform(0, 10, 50))
+    integrator = RateIntegrator('cubic')
+    integrator.update(times, 3 * times**2 - times + 2)
+    antiderivative = times**3 - times**2 / 2 + 2 * times
+    assert integrator.total() == pytest.approx(antiderivative[-1] - antiderivative[0], rel=1e-12)
+
+def test_times_must_increase_across_chunks():
+    integrator = RateIntegrator()
+    integrator.update([0.0, 1.0], [1.0, 2.0])
+    with pytest.raises(ValueError):
+        integrator.update([1.0, 2.0], [2.0, 3.0])
+
+def test_integrate_columns_matches_direct_update(tmp_path, trace):
+    times, rates = trace
+    path_before = list(sys.path)
+    _columnar().write_columns(tmp_path, {'time': times, 'a': rates[:, 0], 'b': rates[:, 1]})
+    streamed = integrate_columns(tmp_path, ['a', 'b'], rule='cubic', window=100)
+    integrator = RateIntegrator('cubic')
+    integrator.update(times, rates[:, :2])
+    np.testing.assert_allclose([streamed['a'], streamed['b']], integrator.total(), rtol=1e-13)
+    # The shared Project5 directory is only ever appended after the existing entries
+    assert sys.path[:len(path_before)] == path_before
@@ -0,0 +1,37 @@
+"""CumulativeIntegral range queries against SciPy's own antiderivative of the same spline."""
+
+import numpy as np
+import pytest
+from scipy.interpolate import CubicSpline, PPoly
+
+from spline_integral import CumulativeIntegral
+
+# Part 2 of ProjectEight.py: per-minute rates in MB/s over 30 minutes
+TIMES = np.arange(0, 31)
+RATES = np.array([24.5, 23.0, 25.5, 22.8, 22.7, 25.2, 24.7, 23.9, 25.1, 25.2, 25.4, 25.3, 24.8, 24.6, 25.7, 25.8,
+                  25.9, 24.9, 25.3, 25.5, 24.8, 23.6, 24.9, 25.1, 25.0, 25.2, 24.8, 24.2, 24.3, 25.4, 25.6])
+
+def test_matches_scipy_antiderivative():
+    spline = CubicSpline(TIMES, RATES)
+    integral = CumulativeIntegral(spline)
+    antiderivative = spline.antiderivative()
+    t0, t1 = np.sort(np.random.default_rng(0).uniform(0, 30, (2, 10000)), axis=0)
+    np.testing.assert_allclose(integral.total(t0, t1), antiderivative(t1) - antiderivative(t0), rtol=0, atol=1e-10)
+    np.testing.assert_allclose(integral(TIMES), antiderivative(TIMES) - antiderivative(0), rtol=0, atol=1e-10)
+
+def test_extrapolates_like_scipy():
+    spline = CubicSpline(TIMES, RATES)
+    antiderivative = spline.antiderivative()
+    t = np.array([-2.0, -0.5, 30.5, 33.0])
+    np.testing.assert_allclose(CumulativeIntegral(spline)(t), antiderivative(t) - antiderivative(0), atol=1e-9)
+
+def test_several_links_and_other_degrees():
+    rates = np.column_stack((RATES, RATES / 2, RATES + 1))
+    spline = CubicSpline(TIMES, rates)
+    antiderivative = spline.antiderivative()
+    np.testing.assert_allclose(CumulativeIntegral(spline).total(3.25, 27.5), antiderivative(27.5) - antiderivative(3.25),
+                               atol=1e-10)
+    # A piecewise quadratic given directly as a PPoly
+    quadratic = PPoly(np.random.default_rng(1).standard_normal((3, 5)), np.array([0, 1, 2.5, 3, 4, 6.0]))
+    assert CumulativeIntegral(quadratic).total(0.2, 5.9) == pytest.approx(
+        quadratic.antiderivative()(5.9) - quadratic.antiderivative()(0.2), abs=1e-12)
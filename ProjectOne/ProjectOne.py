@@ -19,10 +19,10 @@ time grids, interpolates the coarse solution to the fine grid, and visualizes th
 estimation error.
 
 Components:
-- cpu_temperature function: Calculates the rate of change in temperature.
+- cpu_temperature function (cpu_model.py): Calculates the rate of change in temperature.
 - Parameters setup: Defines constants and initial conditions.
-- Solving ODE: Computes temperature on coarse and fine grids.
-- Interpolation: Maps the coarser solution to a finer grid.
+- Solving ODE: Computes temperature on a coarse grid with odeint and the exact solution on a fine grid.
+- Interpolation: Maps the coarser solution to a finer grid and measures its error against the exact solution.
 - Visualization: Plots the CPU temperature and error over time.
 
 Usage:
@@ -37,33 +37,16 @@ dT/dt = H(W)−C(T,A,F) is the functional form. Both represent the exact same eq
 
 
 import numpy as np
-from scipy.integrate import odeint
 import matplotlib.pyplot as plt
 from scipy.interpolate import interp1d
+from cpu_model import solve_temperature
 
 # DIFFERENTIAL EQUATION (Explicit Form):
 # ---------------------------------------
 # dT/dt = k * W^2 - c * F * (T - A)
 # ---------------------------------------
-
-def cpu_temperature(T, t, W, k, c, A, F):
-
-    """Function that will calculate the change in CPU temperature
-	Equation (Functional Form): dT/dt = H(W)−C(T,A,F)
-	dT = change in temperature
-	dt = change in time
-	H(W) = function represented heat generation as a function of workload W
-	C(T,A,F) = function representing cooling as a function of temperature T, 
-	ambient temperature A, and fan speed/cooling system efficiency F."""
-    # Heat generation
-    heat_generated = k * W**2
-
-    # Cooling effect
-    cooling_effect = c * F * (T - A)
-
-    # Change in temperature
-    dTdt = heat_generated - cooling_effect
-    return dTdt
+# cpu_temperature is defined in cpu_model.py, which also provides the exact solution, memoized
+# solves and a fleet simulator for many hosts at once.
 
 # Parameters
 W = 0.7  # Workload (0 to 1)
@@ -75,20 +58,20 @@ F = 1.0  # Cooling system efficiency (0 to 1)
 # Initial condition
 T0 = 30  # Initial CPU temperature (Celsius)
 
-# Solve ODE on Coarser Grid
+# Solve ODE on Coarser Grid (memoized, so re-runs with the same parameters are free)
 t_coarse = np.linspace(0, 10, 100)  # Coarser grid
-temp_coarse = odeint(cpu_temperature, T0, t_coarse, args=(W, k, c, A, F))
+temp_coarse = solve_temperature(t_coarse, T0, W, k, c, A, F, method='odeint')
 
-# Solve ODE on Finer Grid
+# Exact Solution on Finer Grid (the equation is linear in T, so no second numerical solve is needed)
 t_fine = np.linspace(0, 10, 1000)  # Finer grid
-temp_fine = odeint(cpu_temperature, T0, t_fine, args=(W, k, c, A, F))
+temp_fine = solve_temperature(t_fine, T0, W, k, c, A, F, method='exact')
 
 # Interpolate Coarser Solution to Finer Grid
-interpolate_coarse = interp1d(t_coarse, temp_coarse[:, 0], kind='cubic')
+interpolate_coarse = interp1d(t_coarse, temp_coarse, kind='cubic')
 temp_coarse_interpolated = interpolate_coarse(t_fine)
 
-# Calculate Error
-error = np.abs(temp_fine[:, 0] - temp_coarse_interpolated)
+# Calculate Error against the exact solution
+error = np.abs(temp_fine - temp_coarse_interpolated)
 
 # Visualization
 plt.figure(figsize=(12, 6))
@@ -96,7 +79,7 @@ plt.figure(figsize=(12, 6))
 # Subplot 1: Temperature
 plt.subplot(1, 2, 1)
 plt.plot(t_coarse, temp_coarse, label='Coarser Grid')
-plt.plot(t_fine, temp_fine, label='Finer Grid', linestyle='--')
+plt.plot(t_fine, temp_fine, label='Exact Solution', linestyle='--')
 plt.xlabel('Time (seconds)')
 plt.ylabel('CPU Temperature (Celsius)')
 plt.title('CPU Temperature Over Time')
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+"""
+File: convergence.py
+
+Description:
+Grid-convergence study for the CPU temperature model, generalizing the coarse/fine error analysis
+of ProjectOne.py. The model is solved with odeint on a geometric series of grid sizes and solver
+tolerances. Each solution is interpolated (cubic, as in ProjectOne.py) onto a fine evaluation grid
+and compared with the exact solution. Every run records its wall time, right-hand side evaluations
+and max/RMS error, and the study reports the cheapest configuration that meets a target error.
+The table is written as CSV or JSON so it can be tracked in CI to catch performance regressions.
+
+Packages:
+The module uses NumPy, SciPy's 'odeint' and 'interp1d', and the model in cpu_model.py.
+
+Components:
+- convergence_study function: Runs every (grid size, tolerance) pair and returns the table rows.
+- cheapest_configuration function: Picks the run with the fewest RHS evaluations meeting the target.
+- write_table function: Saves the rows as CSV or JSON.
+
+Usage:
+python3 convergence.py [--target 1e-6] [--output convergence.csv]
+The exit status is 1 if no configuration meets the target error.
+"""
+
+import argparse
+import csv
+import json
+import time
+
+import numpy as np
+from scipy.integrate import odeint
+from scipy.interpolate import interp1d
+
+from cpu_model import cpu_temperature, exact_temperature
+
+COLUMNS = ('grid_size', 'tolerance', 'wall_time_s', 'rhs_evals', 'max_error', 'rms_error', 'meets_target')
+
+def convergence_study(grid_sizes=(10, 20, 40, 80, 160, 320, 640), tolerances=(1e-3, 1e-6, 1e-9, 1e-12),
+                      W=0.7, k=0.5, c=0.1, A=25, F=1.0, T0=30, t_end=10, eval_points=1000,
+                      target_error=1e-6, repeats=3):
+    """Solve the model for every combination of grid size and tolerance (rtol = atol).
+    Errors are measured after cubic interpolation onto eval_points evenly spaced times,
+    against the exact solution. wall_time_s is the best of repeats runs of the solve.
+    Returns a list of dicts with the keys in COLUMNS."""
+    t_eval = np.linspace(0, t_end, eval_points)
+    exact = exact_temperature(t_eval, T0, W, k, c, A, F)
+
+    rows = []
+    for grid_size in grid_sizes:
+        t = np.linspace(0, t_end, grid_size)
+        for tolerance in tolerances:
+            wall_time = np.inf
+            for _ in range(repeats):
+                start = time.perf_counter()
+                solution, info = odeint(cpu_temperature, T0, t, args=(W, k, c, A, F),
+                                        rtol=tolerance, atol=tolerance, full_output=True)
+                wall_time = min(wall_time, time.perf_counter() - start)
+
+            interpolated = interp1d(t, solution[:, 0], kind='cubic')(t_eval)
+            error = np.abs(interpolated - exact)
+            rows.append({
+                'grid_size': grid_size,
+                'tolerance': tolerance,
+                'wall_time_s': wall_time,
+                'rhs_evals': int(info['nfe'][-1]),
+                'max_error': float(error.max()),
+                'rms_error': float(np.sqrt(np.mean(error**2))),
+                'meets_target': bool(error.max() <= target_error),
+            })
+    return rows
+
+def cheapest_configuration(rows):
+    """Row meeting the target with the fewest RHS evaluations (ties broken by wall time),
+    or None if no configuration meets it. RHS evaluations are used first because they do
+    not depend on the machine the study runs on."""
+    passing = [row for row in rows if row['meets_target']]
+    if not passing:
+        return None
+    return min(passing, key=lambda row: (row['rhs_evals'], row['wall_time_s']))
+
+def write_table(rows, path):
+    """Write the rows to path as JSON if it ends in .json, otherwise as CSV."""
+    if path.endswith('.json'):
+        with open(path, 'w') as file:
+            json.dump(rows, file, indent=2)
+    else:
+        with open(path, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Grid-convergence study of the CPU temperature model.")
+    parser.add_argument('--target', type=float, default=1e-6, help="target max error (default 1e-6)")
+    parser.add_argument('--output', help="write the table to this .csv or .json file")
+    arguments = parser.parse_args()
+
+    rows = convergence_study(target_error=arguments.target)
+    print(f"{'grid':>6} {'tol':>8} {'time (ms)':>10} {'RHS evals':>10} {'max error':>10} {'RMS error':>10}")
+    for row in rows:
+        print(f"{row['grid_size']:>6} {row['tolerance']:>8.0e} {row['wall_time_s'] * 1e3:>10.3f} "
+              f"{row['rhs_evals']:>10} {row['max_error']:>10.2e} {row['rms_error']:>10.2e}")
+
+    best = cheapest_configuration(rows)
+    if best is None:
+        print(f"\nNo configuration reaches a max error of {arguments.target:.0e}")
+    else:
+        print(f"\nCheapest configuration with max error <= {arguments.target:.0e}: "
+              f"grid_size = {best['grid_size']}, tolerance = {best['tolerance']:.0e} "
+              f"({best['rhs_evals']} RHS evaluations, max error {best['max_error']:.2e})")
+
+    if arguments.output:
+        write_table(rows, arguments.output)
+        print(f"Table written to {arguments.output}")
+
+    # A non-zero exit status lets CI fail when the target can no longer be met
+    if best is None:
+        raise SystemExit(1)
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+
+"""
+File: cpu_model.py
+
+Description:
+CPU temperature model shared by ProjectOne.py and the fleet simulator. The model is the
+differential equation dT/dt = k * W^2 - c * F * (T - A). Because it is linear in T, it has the
+exact solution
+    T(t) = T0 + (k * W^2 - c * F * (T0 - A)) * (1 - exp(-c * F * t)) / (c * F)
+which approaches the equilibrium A + k * W^2 / (c * F).
+
+The fleet simulator models many hosts at once, each with its own W, k, c, A, F and T0. It
+either evaluates the exact solution over NumPy arrays (the fast path) or integrates all
+temperatures as one vector system with a single odeint call.
+
+solve_temperature solves a single host on a time grid, either exactly or with odeint, and
+memoizes the result keyed by (method, W, k, c, A, F, T0, grid) with least-recently-used
+eviction, so repeated runs with the same parameters cost a dictionary lookup.
+
+Packages:
+The module uses NumPy and SciPy's 'odeint'. It does not import Matplotlib.
+
+Components:
+- cpu_temperature function: Calculates the rate of change in temperature.
+- exact_temperature function: Closed-form solution for arrays of hosts.
+- cooling_growth function: Growth factor of the closed-form solution, shared with workload_trace.py.
+- simulate_fleet function: Temperatures of a fleet of hosts, exact or integrated with odeint.
+- solve_temperature function: Memoized single-host solution (exact or odeint) on a time grid.
+- benchmark function: Hosts simulated per second compared with one odeint call per host.
+
+Usage:
+Import the functions from another script, or run 'python3 cpu_model.py' to print the benchmark.
+"""
+
+import time
+from functools import lru_cache
+
+import numpy as np
+from scipy.integrate import odeint
+
+# DIFFERENTIAL EQUATION (Explicit Form):
+# ---------------------------------------
+# dT/dt = k * W^2 - c * F * (T - A)
+# ---------------------------------------
+
+def cpu_temperature(T, t, W, k, c, A, F):
+
+    """Function that will calculate the change in CPU temperature
+	Equation (Functional Form): dT/dt = H(W)−C(T,A,F)
+	dT = change in temperature
+	dt = change in time
+	H(W) = function represented heat generation as a function of workload W
+	C(T,A,F) = function representing cooling as a function of temperature T,
+	ambient temperature A, and fan speed/cooling system efficiency F.
+	W and F may also be functions of time, such as the sampled traces
+	in workload_trace.py."""
+    # Time-varying workload and cooling efficiency
+    if callable(W):
+        W = W(t)
+    if callable(F):
+        F = F(t)
+
+    # Heat generation
+    heat_generated = k * W**2
+
+    # Cooling effect
+    cooling_effect = c * F * (T - A)
+
+    # Change in temperature
+    dTdt = heat_generated - cooling_effect
+    return dTdt
+
+def exact_temperature(t, T0, W, k, c, A, F):
+    """Exact solution of the CPU temperature equation.
+    t = array of times with shape (n,); T0, W, k, c, A, F = scalars or arrays of shape (H,)
+    Returns an (n, H) array (or (n,) if every parameter is a scalar). Hosts without
+    cooling (c * F = 0) heat up linearly; a negative cooling rate raises ValueError."""
+    t = np.asarray(t, dtype=float)
+    T0, W, k, c, A, F = np.broadcast_arrays(*(np.asarray(p, dtype=float) for p in (T0, W, k, c, A, F)))
+    rate = c * F
+    growth = cooling_growth(rate, t.reshape(t.shape + (1,) * rate.ndim))
+    return T0 + (k * W**2 - rate * (T0 - A)) * growth
+
+def cooling_growth(rate, elapsed):
+    """(1 - exp(-rate * elapsed)) / rate, the factor by which the exact solution moves the
+    temperature toward equilibrium, computed with expm1 and equal to elapsed where rate = 0.
+    rate = cooling rate c * F; raises ValueError if it is negative anywhere"""
+    if np.any(rate < 0):
+        raise ValueError("The cooling rate c * F must not be negative")
+    if np.all(rate > 0):
+        return -np.expm1(-rate * elapsed) / rate
+    safe_rate = np.where(rate > 0, rate, 1.0)
+    return np.where(rate > 0, -np.expm1(-safe_rate * elapsed) / safe_rate, elapsed)
+
+def simulate_fleet(t, T0, W, k, c, A, F, method='exact'):
+    """Temperatures of H hosts over the times t, returned as an (n, H) array.
+    T0, W, k, c, A, F = scalars or arrays of shape (H,), one entry per host
+    method = 'exact' evaluates the closed-form solution, 'odeint' integrates all hosts
+    together as one H-dimensional system with a single odeint call"""
+    if method == 'exact':
+        return exact_temperature(t, T0, W, k, c, A, F).reshape(len(t), -1)
+    if method == 'odeint':
+        T0, W, k, c, A, F = np.broadcast_arrays(*(np.atleast_1d(np.asarray(p, dtype=float))
+                                                  for p in (T0, W, k, c, A, F)))
+        return odeint(cpu_temperature, T0, t, args=(W, k, c, A, F))
+    raise ValueError(f"Unknown method {method!r}, expected 'exact' or 'odeint'")
+
+# Cached solutions, keyed by the method, the parameters and the bytes of the time grid
+@lru_cache(maxsize=256)
+def _cached_solution(method, W, k, c, A, F, T0, grid):
+    t = np.frombuffer(grid)
+    if method == 'exact':
+        temperatures = exact_temperature(t, T0, W, k, c, A, F)
+    elif method == 'odeint':
+        temperatures = odeint(cpu_temperature, T0, t, args=(W, k, c, A, F))[:, 0]
+    else:
+        raise ValueError(f"Unknown method {method!r}, expected 'exact' or 'odeint'")
+    temperatures.flags.writeable = False
+    return temperatures
+
+def solve_temperature(t, T0, W, k, c, A, F, method='exact'):
+    """Temperature of one host at the times t, solved exactly or with odeint.
+    Results are memoized (least recently used entries are evicted after 256 solutions),
+    so the returned array is read-only; copy it before modifying it.
+    solve_temperature.cache_info() and solve_temperature.cache_clear() expose the cache."""
+    grid = np.ascontiguousarray(t, dtype=float).tobytes()
+    return _cached_solution(method, float(W), float(k), float(c), float(A), float(F), float(T0), grid)
+
+solve_temperature.cache_info = _cached_solution.cache_info
+solve_temperature.cache_clear = _cached_solution.cache_clear
+
+def _random_fleet(hosts, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(25, 60, hosts),     # T0
+            rng.uniform(0, 1, hosts),       # W
+            rng.uniform(0.3, 0.7, hosts),   # k
+            rng.uniform(0.05, 0.2, hosts),  # c
+            rng.uniform(18, 30, hosts),     # A
+            rng.uniform(0.5, 1, hosts))     # F
+
+def benchmark(fleet_sizes=(10, 1000, 100000), loop_size=200):
+    """Print hosts simulated per second for a loop of per-host odeint calls, one vectorized
+    odeint call for the whole fleet, and the exact solution."""
+    t = np.linspace(0, 10, 100)
+
+    T0, W, k, c, A, F = _random_fleet(loop_size)
+    start = time.perf_counter()
+    for i in range(loop_size):
+        odeint(cpu_temperature, T0[i], t, args=(W[i], k[i], c[i], A[i], F[i]))
+    loop_rate = loop_size / (time.perf_counter() - start)
+    print(f"{'odeint per host':>24}: {loop_rate:14.0f} hosts/s")
+
+    for hosts in fleet_sizes:
+        params = _random_fleet(hosts)
+        for method in ('odeint', 'exact'):
+            if method == 'odeint' and hosts > 10000:
+                continue
+            start = time.perf_counter()
+            simulate_fleet(t, *params, method=method)
+            rate = hosts / (time.perf_counter() - start)
+            print(f"{method + ' fleet, H = ' + str(hosts):>24}: {rate:14.0f} hosts/s  ({rate / loop_rate:.0f}x)")
+
+
+if __name__ == "__main__":
+    # The fleet paths must agree with the per-host odeint solution of ProjectOne.py
+    t = np.linspace(0, 10, 100)
+    single = odeint(cpu_temperature, 30, t, args=(0.7, 0.5, 0.1, 25, 1.0))[:, 0]
+    params = _random_fleet(50)
+    print("max |exact - odeint| for ProjectOne's parameters:",
+          np.max(np.abs(exact_temperature(t, 30, 0.7, 0.5, 0.1, 25, 1.0) - single)))
+    print("max |exact - odeint| over a random fleet of 50 hosts:",
+          np.max(np.abs(simulate_fleet(t, *params) - simulate_fleet(t, *params, method='odeint'))))
+    print()
+    benchmark()
+
+    # Memoized solutions: the second call with the same parameters and grid is a cache hit
+    t_fine = np.linspace(0, 10, 1000)
+    for label in ("first call", "cached call"):
+        start = time.perf_counter()
+        solve_temperature(t_fine, 30, 0.7, 0.5, 0.1, 25, 1.0, method='odeint')
+        print(f"solve_temperature ({label}): {(time.perf_counter() - start) * 1e6:.1f} us")
+    print(solve_temperature.cache_info())
@@ -0,0 +1,24 @@
+"""Closed-form CPU temperatures: exponential approach with cooling, linear heating without it,
+and a negative cooling rate rejected wherever the closed form is used."""
+
+import numpy as np
+import pytest
+
+from cpu_model import exact_temperature
+from workload_trace import simulate_trace
+
+def test_exact_temperature_matches_linear_heating_without_cooling():
+    t = np.linspace(0, 10, 11)
+    temperatures = exact_temperature(t, 30, [0.7, 0.7], 0.5, [0.1, 0.0], 25, 1.0)
+    np.testing.assert_allclose(temperatures[:, 1], 30 + 0.5 * 0.7**2 * t)
+    np.testing.assert_allclose(temperatures[:, 0], 27.45 + (30 - 27.45) * np.exp(-0.1 * t))
+
+@pytest.mark.parametrize('c, F', [(-0.1, 1.0), (0.1, [1.0, -0.5])])
+def test_negative_cooling_rate_raises(c, F):
+    with pytest.raises(ValueError):
+        exact_temperature(np.linspace(0, 10, 11), 30, 0.7, 0.5, c, 25, F)
+
+def test_negative_cooling_rate_raises_in_simulate_trace():
+    chunks = [(np.arange(3.0), np.full(3, 0.7), np.array([1.0, -0.5, 1.0]))]
+    with pytest.raises(ValueError, match="must not be negative"):
+        list(simulate_trace(chunks, T0=30, k=0.5, c=0.1, A=25))
@@ -0,0 +1,18 @@
+"""Throttling switches are root-found and must appear exactly once in the returned samples."""
+
+import numpy as np
+
+from throttling import simulate_throttling
+
+def test_solver_steps_are_strictly_increasing():
+    t, temperatures, workload, switch_times = simulate_throttling(200)
+    assert len(switch_times) > 2
+    assert np.all(np.diff(t) > 0)
+    assert len(t) == len(temperatures) == len(workload)
+    # Each switch point appears exactly once
+    assert all(np.count_nonzero(t == switch) == 1 for switch in switch_times)
+
+def test_t_eval_samples_and_switch_points_are_returned():
+    t_eval = np.linspace(0, 200, 1001)
+    t, temperatures, workload, switch_times = simulate_throttling(200, t_eval=t_eval)
+    np.testing.assert_array_equal(t, np.sort(np.concatenate((t_eval, switch_times))))
@@ -0,0 +1,52 @@
+"""CSV and binary traces read in chunks of any size: blank lines, comments and headers are
+skipped, and a file without samples is an error."""
+
+import numpy as np
+import pytest
+
+from workload_trace import read_trace, write_trace
+
+def read_all(path, chunk_size):
+    chunks = list(read_trace(path, chunk_size))
+    return [np.concatenate(column) for column in zip(*chunks)], chunks
+
+def test_csv_trailing_blank_lines(tmp_path):
+    path = str(tmp_path / 'trace.csv')
+    with open(path, 'w') as file:
+        file.write("time,W,F\n0,0.5,1\n1,0.7,1\n\n2,0.9,0.6\n\n\n\n")
+    for chunk_size in (1, 2, 3, 4, 100):
+        (times, W, F), chunks = read_all(path, chunk_size)
+        assert np.array_equal(times, [0, 1, 2])
+        assert np.array_equal(W, [0.5, 0.7, 0.9])
+        assert np.array_equal(F, [1, 1, 0.6])
+        assert all(len(chunk[0]) > 0 for chunk in chunks)
+
+def test_csv_without_header_matches_binary(tmp_path):
+    times = np.arange(10.0)
+    W = np.linspace(0, 1, 10)
+    F = np.full(10, 0.8)
+    csv_path, binary_path = str(tmp_path / 'trace.csv'), str(tmp_path / 'trace.bin')
+    np.savetxt(csv_path, np.column_stack((times, W, F)), delimiter=',')
+    write_trace(binary_path, times, W, F)
+    for chunk_size in (3, 10, 64):
+        csv_columns, _ = read_all(csv_path, chunk_size)
+        binary_columns, _ = read_all(binary_path, chunk_size)
+        for csv_column, binary_column in zip(csv_columns, binary_columns):
+            assert np.allclose(csv_column, binary_column)
+
+@pytest.mark.parametrize('text', ["# time,W,F\n# no samples yet\n", "time,W,F\n\n# comment\n", "", "0,0.5\n1,0.7\n"])
+def test_csv_without_samples_raises(tmp_path, text):
+    path = str(tmp_path / 'trace.csv')
+    with open(path, 'w') as file:
+        file.write(text)
+    with pytest.raises(ValueError):
+        list(read_trace(path, chunk_size=2))
+
+def test_csv_comment_lines_are_skipped(tmp_path):
+    path = str(tmp_path / 'trace.csv')
+    with open(path, 'w') as file:
+        file.write("# exported trace\ntime,W,F\n0,0.5,1\n# pause\n# pause\n1,0.7,1\n2,0.9,0.6\n")
+    for chunk_size in (1, 2, 100):
+        (times, W, F), chunks = read_all(path, chunk_size)
+        assert np.array_equal(times, [0, 1, 2])
+        assert all(len(chunk[0]) > 0 for chunk in chunks)
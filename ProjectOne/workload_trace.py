@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+"""
+File: workload_trace.py
+
+Description:
+Time-varying workload W(t) and cooling efficiency F(t) for the CPU temperature model. Real
+utilization traces are sampled signals, so they are represented as piecewise-constant segments:
+the value recorded at time t[i] holds until the next sample at t[i+1]. Looking up a value is a
+binary search over the sorted sample times, with no interpolation on every call.
+
+Traces are read from CSV files (columns time, W, F) or raw binary files (float64 rows of
+time, W, F) in fixed-size chunks. Because W and F are constant within each segment, the
+temperature can be advanced through a segment with the exact solution of the model, so a
+day-long trace is simulated chunk by chunk without ever holding the whole trace in memory.
+
+Packages:
+The module uses NumPy and the closed-form growth factor of cpu_model.py (which imports SciPy),
+plus SciPy's 'odeint' for the comparison in the example.
+
+Components:
+- PiecewiseConstant class: Sampled signal with O(log n) lookup, usable as W or F in cpu_temperature.
+- read_trace function: Generator yielding (times, W, F) chunks from a CSV or binary trace file.
+- write_trace function: Writes a trace in the binary format.
+- simulate_trace function: Generator yielding (times, temperatures) chunks for a streamed trace.
+
+Usage:
+Import the functions from another script, or run 'python3 workload_trace.py' for an example
+that streams a synthetic one-day trace.
+"""
+
+import itertools
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from cpu_model import cooling_growth
+
+class PiecewiseConstant:
+    """Sampled signal that holds values[i] from times[i] until times[i + 1].
+    Before times[0] the first value is used, after times[-1] the last one.
+    Calling it with a scalar or an array of times looks the values up by binary search,
+    so a PiecewiseConstant can be passed as W or F to cpu_temperature and odeint."""
+
+    def __init__(self, times, values):
+        self.times = np.asarray(times, dtype=float)
+        self.values = np.asarray(values, dtype=float)
+        if np.any(np.diff(self.times) < 0):
+            raise ValueError("Trace times must be sorted in increasing order")
+
+    def __call__(self, t):
+        index = np.searchsorted(self.times, t, side='right') - 1
+        return self.values[np.clip(index, 0, len(self.values) - 1)]
+
+# Binary trace format: rows of three float64 values (time, W, F)
+_ROW = np.dtype([('time', '<f8'), ('W', '<f8'), ('F', '<f8')])
+
+def write_trace(path, times, W, F):
+    """Write a trace in the binary format read by read_trace."""
+    rows = np.empty(len(times), dtype=_ROW)
+    rows['time'], rows['W'], rows['F'] = times, W, F
+    rows.tofile(path)
+
+# Columns (times, W, F) of a list of CSV lines
+def _parse_csv(lines):
+    data = np.loadtxt(lines, delimiter=',', ndmin=2)
+    if data.shape[1] < 3:
+        raise ValueError(f"Expected the CSV columns time, W, F, got {data.shape[1]} column(s)")
+    return data[:, 0], data[:, 1], data[:, 2]
+
+# Lines of a CSV trace that hold samples: not blank and not a '#' comment
+def _is_sample(line):
+    line = line.strip()
+    return bool(line) and not line.startswith('#')
+
+def read_trace(path, chunk_size=65536):
+    """Yield (times, W, F) arrays of at most chunk_size samples from a trace file.
+    Files ending in .csv are parsed as text with the columns time, W, F (an optional header
+    line, blank lines and '#' comment lines are skipped); any other file is read as binary
+    float64 rows (see write_trace). Raises ValueError if the file holds no samples."""
+    samples = 0
+    if path.endswith('.csv'):
+        with open(path) as file:
+            first = next((line for line in file if _is_sample(line)), '')
+            lines = [] if not first or first.lstrip()[0].isalpha() else [first]
+            while True:
+                if len(lines) == chunk_size:
+                    samples += len(lines)
+                    yield _parse_csv(lines)
+                    lines = []
+                batch = list(itertools.islice(file, chunk_size - len(lines)))
+                # Blank and comment lines are dropped here, so they never form a chunk
+                lines += [line for line in batch if _is_sample(line)]
+                if not batch:
+                    if lines:
+                        samples += len(lines)
+                        yield _parse_csv(lines)
+                    break
+    else:
+        with open(path, 'rb') as file:
+            while True:
+                rows = np.fromfile(file, dtype=_ROW, count=chunk_size)
+                if len(rows) == 0:
+                    break
+                samples += len(rows)
+                yield rows['time'], rows['W'], rows['F']
+    if samples == 0:
+        raise ValueError(f"Trace file {path} contains no samples")
+
+def simulate_trace(chunks, T0, k, c, A):
+    """Simulate the CPU temperature through a streamed workload trace.
+    chunks = iterable of (times, W, F) arrays, such as read_trace(path)
+    Yields (times, temperatures) with the temperature at every sample time. Within each
+    segment W and F are constant, so the temperature is advanced with the exact solution
+    T_next = T_eq + (T - T_eq) * exp(-c * F * dt), where T_eq = A + k * W^2 / (c * F).
+    Raises ValueError if c * F is negative anywhere, as exact_temperature does."""
+    T = float(T0)
+    pending = None
+    for times, W, F in chunks:
+        # The last sample of the previous chunk lasts until the first sample of this one
+        if pending is not None:
+            times = np.concatenate(([pending[0]], times))
+            W = np.concatenate(([pending[1]], W))
+            F = np.concatenate(([pending[2]], F))
+        pending = (times[-1], W[-1], F[-1])
+
+        # Per-segment decay factor a and forcing b, so that T_next = a * T + b
+        rate = c * F[:-1]
+        growth = cooling_growth(rate, np.diff(times))
+        decay = (1 - rate * growth).tolist()
+        forcing = ((k * W[:-1]**2 + rate * A) * growth).tolist()
+
+        temperatures = np.empty(len(times) - 1)
+        for i in range(len(decay)):
+            temperatures[i] = T
+            T = decay[i] * T + forcing[i]
+        yield times[:-1], temperatures
+
+    if pending is not None:
+        yield np.array([pending[0]]), np.array([T])
+
+
+if __name__ == "__main__":
+    from scipy.integrate import odeint
+
+    from cpu_model import cpu_temperature
+
+    # Synthetic one-day trace sampled every 0.1 seconds (864,000 samples)
+    rng = np.random.default_rng(0)
+    times = np.arange(0, 86400, 0.1)
+    W = np.clip(0.5 + 0.3 * np.sin(times / 3600) + 0.1 * rng.standard_normal(len(times)), 0, 1)
+    F = np.where((times // 600) % 2 == 0, 1.0, 0.6)
+
+    path = os.path.join(tempfile.mkdtemp(), 'trace.bin')
+    write_trace(path, times, W, F)
+    print(f"Trace file: {os.path.getsize(path) / 1e6:.1f} MB, {len(times)} samples")
+
+    start = time.perf_counter()
+    samples = 0
+    for chunk_times, temperatures in simulate_trace(read_trace(path), T0=30, k=0.5, c=0.1, A=25):
+        samples += len(chunk_times)
+    elapsed = time.perf_counter() - start
+    print(f"Streamed {samples} samples in {elapsed:.2f} s ({samples / elapsed:.0f} samples/s), "
+          f"final temperature {temperatures[-1]:.3f} C")
+
+    # Check the segment-exact solution against odeint with piecewise-constant lookups
+    window = slice(0, 600)
+    workload = PiecewiseConstant(times[window], W[window])
+    cooling = PiecewiseConstant(times[window], F[window])
+    t = times[window]
+    reference = odeint(cpu_temperature, 30, t, args=(workload, 0.5, 0.1, 25, cooling), hmax=0.1)[:, 0]
+    _, streamed = next(simulate_trace([(t, W[window], F[window])], T0=30, k=0.5, c=0.1, A=25))
+    print(f"max |stream - odeint| over the first minute: {np.max(np.abs(streamed - reference[:-1])):.2e}")